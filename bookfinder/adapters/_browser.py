@@ -2,9 +2,15 @@
 
 import asyncio
 import random
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext
 
 _PLAYWRIGHT_AVAILABLE = False
 try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     from playwright.async_api import async_playwright
     from playwright_stealth import stealth_async
     _PLAYWRIGHT_AVAILABLE = True
@@ -12,11 +18,81 @@ except ImportError:
     pass
 
 
+# Worst case for one fetch_rendered_html() call at the default timeout: a
+# cold Chromium launch, the pre-navigation delay, then goto and the selector
+# wait at 20s each. Adapters that render pages use it as their search budget.
+SEARCH_BUDGET = 60.0
+
+# One Chromium process per interpreter; each fetch opens its own page
+_pw: Any = None
+_browser_obj: Any = None
+_context: Any = None
+_lock: asyncio.Lock | None = None
+
+
 def is_available() -> bool:
     return _PLAYWRIGHT_AVAILABLE
 
 
-async def fetch_rendered_html(url: str, wait_selector: str | None = None, timeout: int = 20000) -> str:
+async def get_context() -> "BrowserContext":
+    """Return the shared browser context, launching Chromium on first use."""
+    global _pw, _browser_obj, _context, _lock
+    if _lock is None:
+        _lock = asyncio.Lock()
+    async with _lock:
+        if _browser_obj is not None and not _browser_obj.is_connected():
+            # Chromium crashed or was killed; start over rather than failing
+            # every later fetch until the process restarts
+            await _close()
+        if _context is None:
+            try:
+                _pw = await async_playwright().start()
+                _browser_obj = await _pw.chromium.launch(headless=True)
+                # Use a more realistic context
+                _context = await _browser_obj.new_context(
+                    user_agent=(
+                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+                    ),
+                    viewport={"width": 1280, "height": 720},
+                    device_scale_factor=1,
+                )
+            except BaseException:
+                # Cancelled or failed part-way: don't leave a half-started
+                # browser behind for the next caller to trip over
+                await _close()
+                raise
+    return _context
+
+
+async def _close() -> None:
+    global _pw, _browser_obj, _context
+    pw, browser, context = _pw, _browser_obj, _context
+    _pw = _browser_obj = _context = None
+    # Best effort: after a crash the handles may already be dead
+    if context is not None:
+        with suppress(Exception):
+            await context.close()
+    if browser is not None:
+        with suppress(Exception):
+            await browser.close()
+    if pw is not None:
+        with suppress(Exception):
+            await pw.stop()
+
+
+async def shutdown() -> None:
+    """Close the shared browser, if one was launched."""
+    global _lock
+    await _close()
+    _lock = None
+
+
+async def fetch_rendered_html(
+    url: str,
+    wait_selector: str | None = None,
+    timeout: int = 20000,
+) -> str:
     """Fetch a rendered page via headless Chromium with stealth enabled."""
     if not _PLAYWRIGHT_AVAILABLE:
         raise RuntimeError(
@@ -24,39 +100,32 @@ async def fetch_rendered_html(url: str, wait_selector: str | None = None, timeou
             "Install it with: pip install bookpricefinder[browser] && playwright install chromium"
         )
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        # Use a more realistic context
-        context = await browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ),
-            viewport={"width": 1280, "height": 720},
-            device_scale_factor=1,
-        )
-        page = await context.new_page()
-        
+    context = await get_context()
+    page = await context.new_page()
+
+    try:
         # Apply stealth
         await stealth_async(page)
-        
-        try:
-            # Human-like delay before navigating
-            await asyncio.sleep(random.uniform(0.5, 1.5))
-            
-            await page.goto(url, wait_until="networkidle", timeout=timeout)
-            
-            if wait_selector:
-                try:
-                    await page.wait_for_selector(wait_selector, timeout=timeout)
-                except Exception:
-                    # Fallback: if selector doesn't appear, just wait a bit more
-                    await asyncio.sleep(3)
-            else:
-                await asyncio.sleep(3)
-                
-            html = await page.content()
-        finally:
-            await browser.close()
+
+        # Human-like delay before navigating
+        await asyncio.sleep(random.uniform(0.5, 1.5))
+
+        await page.goto(url, wait_until="networkidle", timeout=timeout)
+
+        if wait_selector:
+            try:
+                await page.wait_for_selector(wait_selector, timeout=timeout)
+            except PlaywrightTimeoutError:
+                # Selector never showed up; take whatever has rendered so far
+                pass
+        else:
+            try:
+                await page.wait_for_load_state("networkidle", timeout=3000)
+            except PlaywrightTimeoutError:
+                pass
+
+        html = await page.content()
+    finally:
+        await page.close()
 
     return html
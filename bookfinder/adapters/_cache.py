@@ -0,0 +1,72 @@
+"""Small on-disk cache for raw adapter responses, keyed by URL and params."""
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from platformdirs import user_cache_dir
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = Path(user_cache_dir("bookfinder")) / "responses"
+
+# Every this many writes, files older than MAX_AGE seconds are swept, so
+# entries that are never read again don't pile up on disk
+SWEEP_EVERY = 100
+MAX_AGE = 24 * 60 * 60
+
+_puts = 0
+
+
+def _path(url: str, params: dict[str, Any] | None) -> Path:
+    parts = [url] + [f"{k}={v}" for k, v in sorted((params or {}).items())]
+    return CACHE_DIR / hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def get(url: str, params: dict[str, Any] | None, ttl: float) -> bytes | None:
+    """Return the cached body if it is younger than ``ttl`` seconds."""
+    if ttl <= 0:
+        return None
+    path = _path(url, params)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            path.unlink(missing_ok=True)
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def put(url: str, params: dict[str, Any] | None, body: bytes) -> None:
+    """Store a response body; failures are logged and otherwise ignored."""
+    path = _path(url, params)
+    tmp = path.with_suffix(".tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(body)
+        os.replace(tmp, path)
+    except OSError as e:
+        log.debug("Could not write response cache for %s: %s", url, e)
+
+    global _puts
+    _puts += 1
+    if _puts % SWEEP_EVERY == 0:
+        sweep()
+
+
+def sweep(max_age: float = MAX_AGE) -> None:
+    """Delete cached bodies older than ``max_age`` seconds."""
+    cutoff = time.time() - max_age
+    try:
+        entries = list(CACHE_DIR.iterdir())
+    except OSError:
+        return
+    for path in entries:
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            continue
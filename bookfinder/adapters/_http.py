@@ -0,0 +1,32 @@
+"""Shared httpx client so adapters reuse pooled connections between searches."""
+
+import asyncio
+
+import httpx
+
+_CLIENTS: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the client bound to the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        # Drop clients left behind by loops that have since been closed
+        for stale in [lp for lp in _CLIENTS if lp.is_closed()]:
+            del _CLIENTS[stale]
+        client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=20.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+        _CLIENTS[loop] = client
+    return client
+
+
+async def aclose() -> None:
+    """Close the client bound to the running event loop, if any."""
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
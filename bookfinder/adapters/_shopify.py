@@ -0,0 +1,58 @@
+"""Helpers for Shopify storefronts that expose the search/suggest.json API."""
+
+from typing import Any
+
+from bookfinder.models import BookResult, Condition
+
+
+def suggest_params(term: str, limit: int) -> dict[str, str]:
+    """Query parameters for a product-only suggest.json lookup."""
+    return {
+        "q": term,
+        "resources[type]": "product",
+        "resources[limit]": str(limit),
+    }
+
+
+def parse_suggest(
+    data: dict[str, Any],
+    source: str,
+    base_url: str,
+    condition: Condition = Condition.USED,
+) -> list[BookResult]:
+    """Convert a suggest.json payload into results."""
+    products = data.get("resources", {}).get("results", {}).get("products", [])
+
+    results: list[BookResult] = []
+    for product in products:
+        title = product.get("title", "")
+        if not title:
+            continue
+
+        try:
+            price = float(product.get("price", 0))
+            if price <= 0:
+                price = float(product.get("price_max", 0))
+            if price <= 0:
+                price = float(product.get("price_min", 0))
+        except (ValueError, TypeError):
+            continue
+
+        if price <= 0:
+            continue
+
+        url_path = product.get("url", "").partition("?")[0]
+        url = f"{base_url}{url_path}" if url_path else ""
+
+        results.append(
+            BookResult(
+                title=title,
+                author=product.get("vendor", "Unknown"),
+                price=price,
+                condition=condition,
+                source=source,
+                url=url,
+            )
+        )
+
+    return results
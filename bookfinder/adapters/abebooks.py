@@ -1,6 +1,9 @@
 """AbeBooks adapter — HTML scraping with data-test-id selectors and microdata."""
 
-from bs4 import BeautifulSoup
+from typing import Any
+
+from lxml import etree
+from lxml import html as lxml_html
 
 from bookfinder.adapters.base import BaseAdapter
 from bookfinder.models import BookQuery, BookResult
@@ -8,6 +11,19 @@ from bookfinder.utils.parsing import parse_condition, parse_price, parse_shippin
 
 SEARCH_URL = "https://www.abebooks.com/servlet/SearchResults"
 
+# Compiled once; evaluation runs entirely inside libxml2
+_LISTINGS = etree.XPath('//li[@data-test-id="listing-item"]')
+_ISBN = etree.XPath('.//meta[@itemprop="isbn"]/@content')
+_NAME = etree.XPath('.//meta[@itemprop="name"]/@content')
+_AUTHOR = etree.XPath('.//meta[@itemprop="author"]/@content')
+_TITLE_EL = etree.XPath('.//*[@data-test-id="listing-title"]')
+_AUTHOR_EL = etree.XPath('.//*[@data-test-id="listing-author"]')
+_PRICE_EL = etree.XPath('.//*[@data-test-id="item-price"]')
+_COND_EL = etree.XPath('.//*[@data-test-id="listing-book-condition"]')
+_BUY_BOX = etree.XPath('.//*[starts-with(@data-test-id, "buy-box-data")]')
+_DETAIL_HREF = etree.XPath('.//a[contains(@href, "/bd")]/@href')
+_ANY_HREF = etree.XPath('.//a/@href')
+
 
 class AbeBooksAdapter(BaseAdapter):
     @property
@@ -25,50 +41,52 @@ class AbeBooksAdapter(BaseAdapter):
         else:
             params["kn"] = query.query
 
-        html = await self._fetch_html(SEARCH_URL, params=params)
-        return self._parse(html)
+        return await self._fetch_parsed(SEARCH_URL, params, self._parse)
 
     def _parse(self, html: str) -> list[BookResult]:
-        soup = BeautifulSoup(html, "html.parser")
+        try:
+            tree = lxml_html.fromstring(html)
+        except (etree.ParserError, ValueError):
+            return []
         results: list[BookResult] = []
 
-        for item in soup.select('li[data-test-id="listing-item"]'):
+        for item in _LISTINGS(tree):
             # Prefer microdata
-            isbn_meta = item.select_one('meta[itemprop="isbn"]')
-            name_meta = item.select_one('meta[itemprop="name"]')
-            author_meta = item.select_one('meta[itemprop="author"]')
+            isbn_meta = _first(_ISBN(item))
+            name_meta = _first(_NAME(item))
+            author_meta = _first(_AUTHOR(item))
 
             # Fallback to data-test-id
-            title_el = item.select_one('[data-test-id="listing-title"]')
-            author_el = item.select_one('[data-test-id="listing-author"]')
-            price_el = item.select_one('[data-test-id="item-price"]')
-            cond_el = item.select_one('[data-test-id="listing-book-condition"]')
-
-            title = str(name_meta["content"] if name_meta else
-                       title_el.get_text(strip=True) if title_el else "")
-            if not title or not price_el:
+            title_el = _first(_TITLE_EL(item))
+            author_el = _first(_AUTHOR_EL(item))
+            price_el = _first(_PRICE_EL(item))
+            cond_el = _first(_COND_EL(item))
+
+            title = str(name_meta if name_meta is not None else
+                        _text(title_el) if title_el is not None else "")
+            if not title or price_el is None:
                 continue
 
-            author = str(author_meta["content"] if author_meta else
-                         author_el.get_text(strip=True) if author_el else "Unknown")
-            isbn = str(isbn_meta["content"]) if isbn_meta else ""
+            author = str(author_meta if author_meta is not None else
+                         _text(author_el) if author_el is not None else "Unknown")
+            isbn = str(isbn_meta) if isbn_meta is not None else ""
 
-            price = parse_price(price_el.get_text())
-            condition = parse_condition(cond_el.get_text(strip=True) if cond_el else "")
+            price = parse_price(price_el.text_content())
+            condition = parse_condition(_text(cond_el) if cond_el is not None else "")
 
             # Shipping info
             shipping = None
-            buy_box = item.select_one('[data-test-id^="buy-box-data"]')
-            if buy_box:
-                shipping = parse_shipping(buy_box.get_text())
-
-            # Build URL
-            link = (
-                item.select_one("a[data-test-id='listing-title']")
-                or item.select_one("a[href*='/bd']")
-                or item.select_one("a[href]")
-            )
-            href = str(link.get("href", "")) if link else ""
+            buy_box = _first(_BUY_BOX(item))
+            if buy_box is not None:
+                shipping = parse_shipping(buy_box.text_content())
+
+            # Build URL from the title node we already have before scanning again
+            href = ""
+            if title_el is not None:
+                href = title_el.get("href") or _first(_ANY_HREF(title_el)) or ""
+            if not href:
+                href = _first(_DETAIL_HREF(item)) or _first(_ANY_HREF(item)) or ""
+            href = str(href)
             url = href if href.startswith("http") else f"https://www.abebooks.com{href}"
 
             results.append(
@@ -76,7 +94,6 @@ class AbeBooksAdapter(BaseAdapter):
                     title=title,
                     author=author,
                     price=price,
-                    currency="USD",
                     condition=condition,
                     source=self.name,
                     url=url,
@@ -86,3 +103,11 @@ class AbeBooksAdapter(BaseAdapter):
             )
 
         return results
+
+
+def _first(nodes: Any) -> Any:
+    return nodes[0] if nodes else None
+
+
+def _text(el: Any) -> str:
+    return " ".join(str(el.text_content()).split())
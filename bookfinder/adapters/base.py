@@ -3,10 +3,12 @@
 import random
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any, Optional
 
-import httpx
+import orjson
 
+from bookfinder.adapters import _browser, _cache, _http
 from bookfinder.models import BookQuery, BookResult
 
 log = logging.getLogger(__name__)
@@ -21,6 +23,11 @@ USER_AGENTS = [
 class BaseAdapter(ABC):
     """Interface for a book price source."""
 
+    # Seconds a fetched page stays in the on-disk response cache
+    cache_ttl: float = 15 * 60
+    # Searches get at least this long, even when the configured timeout is lower
+    min_timeout: float = 0.0
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -41,6 +48,7 @@ class BaseAdapter(ABC):
             "User-Agent": random.choice(USER_AGENTS),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
             "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, br",
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
             "Sec-Fetch-Dest": "document",
@@ -52,25 +60,67 @@ class BaseAdapter(ABC):
 
     async def _fetch_html(self, url: str, params: Optional[dict[str, Any]] = None, timeout: float = 20.0) -> str:
         """Shared helper to fetch HTML from a URL."""
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            headers=self.get_headers(),
-            timeout=timeout,
-        ) as client:
-            resp = await client.get(url, params=params)
-            resp.raise_for_status()
-            return resp.text
+        client = await _http.get_client()
+        resp = await client.get(url, params=params, headers=self.get_headers(), timeout=timeout)
+        resp.raise_for_status()
+        return resp.text
+
+    async def _fetch_parsed(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        parse: Callable[[str], list[BookResult]],
+        timeout: float = 20.0,
+    ) -> list[BookResult]:
+        """Fetch an HTML search page and parse it.
+
+        Only pages that parse to at least one result are cached, so a
+        captcha or empty page served with a 200 is retried on the next search.
+        """
+        cached = _cache.get(url, params, self.cache_ttl)
+        if cached is not None:
+            return parse(cached.decode("utf-8"))
+
+        client = await _http.get_client()
+        resp = await client.get(url, params=params, headers=self.get_headers(), timeout=timeout)
+        resp.raise_for_status()
+        results = parse(resp.text)
+        if results and self.cache_ttl and "no-store" not in resp.headers.get("Cache-Control", ""):
+            _cache.put(url, params, resp.text.encode("utf-8"))
+        return results
 
     async def _fetch_json(self, url: str, params: Optional[dict[str, Any]] = None, timeout: float = 15.0) -> Any:
         """Shared helper to fetch JSON from a URL."""
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            headers=self.get_headers(),
-            timeout=timeout,
-        ) as client:
-            resp = await client.get(url, params=params)
-            resp.raise_for_status()
-            return resp.json()
+        cached = _cache.get(url, params, self.cache_ttl)
+        if cached is not None:
+            return orjson.loads(cached)
+
+        headers = self.get_headers()
+        headers["Accept"] = "application/json, */*;q=0.1"
+        client = await _http.get_client()
+        resp = await client.get(url, params=params, headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        if "no-store" not in resp.headers.get("Cache-Control", ""):
+            _cache.put(url, params, resp.content)
+        return data
+
+    async def _fetch_rendered(
+        self,
+        url: str,
+        wait_selector: str,
+        parse: Callable[[str], list[BookResult]],
+    ) -> list[BookResult]:
+        """Render a page in the browser and parse it, caching like _fetch_parsed."""
+        cached = _cache.get(url, None, self.cache_ttl)
+        if cached is not None:
+            return parse(cached.decode("utf-8"))
+
+        html = await _browser.fetch_rendered_html(url, wait_selector=wait_selector)
+        results = parse(html)
+        if results and self.cache_ttl:
+            _cache.put(url, None, html.encode("utf-8"))
+        return results
 
     async def is_available(self) -> bool:
         """Check if the source is reachable."""
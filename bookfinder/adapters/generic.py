@@ -1,18 +1,24 @@
 """Generic adapter for Schema.org Product/Offer data."""
 
-import json
 import logging
+import re
 from typing import Any
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
 
+from bookfinder.adapters import _http
 from bookfinder.adapters.base import BaseAdapter
 from bookfinder.models import BookQuery, BookResult
 from bookfinder.utils.parsing import parse_condition
 
 log = logging.getLogger(__name__)
 
+_LDJSON_RE = re.compile(
+    r"""<script[^>]+type=["']application/ld\+json["'][^>]*>(.*?)</script>""",
+    re.DOTALL | re.IGNORECASE,
+)
+
 
 class GenericAdapter(BaseAdapter):
     """Scrape any site that uses Schema.org Product/Offer structured data."""
@@ -35,20 +41,20 @@ class GenericAdapter(BaseAdapter):
         url = self._search_url_template.format(query=search_term)
         
         # We need the final URL after redirects for metadata
-        async with httpx.AsyncClient(follow_redirects=True, headers=self.get_headers()) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            return self._parse_structured_data(resp.text, resp.url)
+        client = await _http.get_client()
+        resp = await client.get(url, headers=self.get_headers())
+        resp.raise_for_status()
+        return self._parse_structured_data(resp.text, resp.url)
 
     def _parse_structured_data(self, html: str, page_url: httpx.URL) -> list[BookResult]:
         """Extract offers from JSON-LD."""
-        soup = BeautifulSoup(html, "html.parser")
         results: list[BookResult] = []
 
-        for script in soup.find_all("script", type="application/ld+json"):
+        # Pull the script bodies straight out of the markup; no DOM needed
+        for match in _LDJSON_RE.finditer(html):
             try:
-                data = json.loads(script.string or "")
-            except (json.JSONDecodeError, TypeError):
+                data = orjson.loads(match.group(1))
+            except orjson.JSONDecodeError:
                 continue
 
             items = data if isinstance(data, list) else [data]
@@ -7,6 +7,9 @@ API_URL = "https://gutendex.com/books/"
 
 
 class GutenbergAdapter(BaseAdapter):
+    # Catalogue data, not prices — safe to reuse for a day
+    cache_ttl = 24 * 60 * 60
+
     @property
     def name(self) -> str:
         return "Project Gutenberg"
@@ -38,7 +41,6 @@ class GutenbergAdapter(BaseAdapter):
                     title=title,
                     author=author_str,
                     price=0.0,
-                    currency="USD",
                     condition=Condition.NEW,
                     source=self.name,
                     url=url,
@@ -1,24 +1,43 @@
-"""Half Price Books (hpb.com) adapter — uses Playwright for bot protection bypass.
+"""Half Price Books (hpb.com) adapter — Shopify suggest.json, then Playwright.
 
-HPB has aggressive bot protection (403 for plain HTTP requests).
-Uses Playwright headless browser when available.
+HPB runs on Shopify, so the suggest.json API is tried first. Its HTML
+search pages have aggressive bot protection (403 for plain HTTP requests),
+so those are only fetched through a Playwright headless browser when the
+API comes back empty or unusable.
 """
 
 import logging
+import re
 
+import httpx
+import orjson
 from bs4 import BeautifulSoup
 
-from bookfinder.adapters import _browser
+from bookfinder.adapters import _browser, _shopify
 from bookfinder.adapters.base import BaseAdapter
-from bookfinder.models import BookQuery, BookResult
-from bookfinder.utils.parsing import parse_condition, parse_price
+from bookfinder.models import BookQuery, BookResult, Condition
+from bookfinder.utils.parsing import clean_text, parse_condition, parse_price, select_first
 
 log = logging.getLogger(__name__)
 
 SEARCH_URL = "https://www.hpb.com/products"
+SUGGEST_URL = "https://www.hpb.com/search/suggest.json"
+
+_BLOCKED_RE = re.compile(r"we\s+got\s+lost\s+in\s+a\s+good\s+book", re.IGNORECASE)
+
+# Most specific first; the broad patterns also match grid wrappers
+_CARD_SELECTORS = (
+    ".product-item",
+    ".product-card",
+    "[class*='product'] [class*='item']",
+    "[data-product-id]",
+)
 
 
 class HPBAdapter(BaseAdapter):
+    # Falls back to (or always needs) a rendered page
+    min_timeout = _browser.SEARCH_BUDGET
+
     @property
     def name(self) -> str:
         return "Half Price Books"
@@ -28,48 +47,52 @@ class HPBAdapter(BaseAdapter):
         return "https://www.hpb.com"
 
     async def search(self, query: BookQuery) -> list[BookResult]:
+        search_term = query.isbn if query.isbn else query.query
+
+        results = await self._fetch_suggest(search_term, query.max_results)
+        if results:
+            return results
+
         if not _browser.is_available():
             log.warning("Playwright not available, skipping HPB to avoid 403 block.")
             return []
 
-        search_term = query.isbn if query.isbn else query.query
         url = f"{SEARCH_URL}?keyword={search_term}"
         
         try:
-            html = await _browser.fetch_rendered_html(
-                url, 
-                wait_selector=".product-item, .product-card, [data-product-id]"
+            return await self._fetch_rendered(
+                url,
+                wait_selector="[class*='product'], [data-product-id], .no-results",
+                parse=self._parse,
             )
-            return self._parse(html)
         except Exception as e:
             log.error("HPB search failed: %s", e)
             return []
 
-    def _parse(self, html: str) -> list[BookResult]:
-        soup = BeautifulSoup(html, "html.parser")
-        results: list[BookResult] = []
+    async def _fetch_suggest(self, search_term: str, limit: int) -> list[BookResult]:
+        """Query the Shopify suggest API; empty if it errors or isn't JSON."""
+        try:
+            data = await self._fetch_json(SUGGEST_URL, params=_shopify.suggest_params(search_term, limit))
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            log.debug("HPB suggest.json unavailable, falling back to browser: %s", e)
+            return []
+        if not isinstance(data, dict):
+            return []
+        # Suggest results don't say new vs used
+        return _shopify.parse_suggest(data, self.name, self.base_url, condition=Condition.UNKNOWN)
 
-        page_text = soup.get_text(" ", strip=True).lower()
-        if "we got lost in a good book" in page_text or "403 Forbidden" in html:
-            logging.getLogger(__name__).warning("Half Price Books blocked the request.")
+    def _parse(self, html: str) -> list[BookResult]:
+        # Check the raw markup before paying for a parse
+        if _BLOCKED_RE.search(html) or "403 Forbidden" in html:
+            log.warning("Half Price Books blocked the request.")
             return []
 
-        cards = (
-            soup.select(".product-item")
-            or soup.select(".product-card")
-            or soup.select("[class*='product'] [class*='item']")
-            or soup.select("[data-product-id]")
-        )
-
-        for card in cards:
-            title_el = (
-                card.select_one("[class*='title']")
-                or card.select_one("h2 a, h3 a")
-            )
-            price_el = (
-                card.select_one("[class*='price']")
-                or card.select_one(".money")
-            )
+        soup = BeautifulSoup(html, "lxml")
+        results: list[BookResult] = []
+
+        for card in select_first(soup, _CARD_SELECTORS):
+            title_el = card.select_one("[class*='title']") or card.select_one("h2 a, h3 a")
+            price_el = card.select_one("[class*='price']") or card.select_one(".money")
 
             if not (title_el and price_el):
                 continue
@@ -82,17 +105,16 @@ class HPBAdapter(BaseAdapter):
             condition_el = card.select_one("[class*='condition']")
             link_el = card.select_one("a[href*='/products/']") or card.select_one("a[href]")
 
-            condition = parse_condition(condition_el.get_text(strip=True) if condition_el else "")
+            condition = parse_condition(clean_text(condition_el) if condition_el else "")
 
             href = str(link_el.get("href", "")) if link_el else ""
             url = href if href.startswith("http") else f"https://www.hpb.com{href}"
 
             results.append(
                 BookResult(
-                    title=title_el.get_text(strip=True),
-                    author=author_el.get_text(strip=True) if author_el else "Unknown",
+                    title=clean_text(title_el),
+                    author=clean_text(author_el) if author_el else "Unknown",
                     price=price,
-                    currency="USD",
                     condition=condition,
                     source=self.name,
                     url=url,
@@ -7,6 +7,9 @@ API_BASE = "https://openlibrary.org"
 
 
 class OpenLibraryAdapter(BaseAdapter):
+    # Catalogue data, not prices — safe to reuse for a day
+    cache_ttl = 24 * 60 * 60
+
     @property
     def name(self) -> str:
         return "Open Library"
@@ -36,7 +39,6 @@ class OpenLibraryAdapter(BaseAdapter):
                     title=doc.get("title", "Unknown"),
                     author=", ".join(doc.get("author_name", ["Unknown"])),
                     price=0.0,
-                    currency="USD",
                     condition=Condition.UNKNOWN,
                     source=self.name,
                     url=f"{API_BASE}{key}",
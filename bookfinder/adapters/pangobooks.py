@@ -9,12 +9,23 @@ from bs4 import BeautifulSoup
 from bookfinder.adapters import _browser
 from bookfinder.adapters.base import BaseAdapter
 from bookfinder.models import BookQuery, BookResult
-from bookfinder.utils.parsing import parse_condition, parse_price
+from bookfinder.utils.parsing import clean_text, parse_condition, parse_price, select_first
 
 SEARCH_URL = "https://pangobooks.com/search"
 
+# Most specific first; the broad patterns also match grid wrappers
+_CARD_SELECTORS = (
+    "[data-testid*='book-card']",
+    "div[class*='book-tile']",
+    "[class*='BookCard']",
+    "[class*='listing-card']",
+    "a[href*='/books/']",
+)
+
 
 class PangoBooksAdapter(BaseAdapter):
+    min_timeout = _browser.SEARCH_BUDGET
+
     @property
     def name(self) -> str:
         return "PangoBooks"
@@ -31,30 +42,20 @@ class PangoBooksAdapter(BaseAdapter):
         url = f"{SEARCH_URL}?q={search_term}"
 
         # Broaden wait selector
-        html = await _browser.fetch_rendered_html(
+        return await self._fetch_rendered(
             url,
             wait_selector="[data-testid*='book'], [class*='book'], [class*='listing']",
+            parse=self._parse,
         )
 
-        return self._parse(html)
-
     async def is_available(self) -> bool:
         return _browser.is_available()
 
     def _parse(self, html: str) -> list[BookResult]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         results: list[BookResult] = []
 
-        # Find listing cards with broader patterns
-        cards = (
-            soup.select("[data-testid*='book-card']")
-            or soup.select("div[class*='book-tile']")
-            or soup.select("[class*='BookCard']")
-            or soup.select("[class*='listing-card']")
-            or soup.select("a[href*='/books/']")
-        )
-
-        for card in cards:
+        for card in select_first(soup, _CARD_SELECTORS):
             if card.name == "a":
                 link = card
                 container = card
@@ -70,7 +71,7 @@ class PangoBooksAdapter(BaseAdapter):
             price_el = container.select_one("[class*='price'], [class*='Price'], [data-testid*='price']")
             condition_el = container.select_one("[class*='condition'], [class*='Condition']")
 
-            title = title_el.get_text(strip=True) if title_el else ""
+            title = clean_text(title_el) if title_el else ""
             if not title:
                 continue
 
@@ -85,14 +86,13 @@ class PangoBooksAdapter(BaseAdapter):
                 href = str(link.get("href", ""))
             url = href if href.startswith("http") else f"https://pangobooks.com{href}"
 
-            condition = parse_condition(condition_el.get_text(strip=True) if condition_el else "used")
+            condition = parse_condition(clean_text(condition_el) if condition_el else "used")
 
             results.append(
                 BookResult(
                     title=title,
-                    author=author_el.get_text(strip=True) if author_el else "Unknown",
+                    author=clean_text(author_el) if author_el else "Unknown",
                     price=price,
-                    currency="USD",
                     condition=condition,
                     source=self.name,
                     url=url,
@@ -1,34 +1,51 @@
 """Adapter registry — central place to manage which sources are active."""
 
-from bookfinder.adapters.base import BaseAdapter
-from bookfinder.adapters.generic import GenericAdapter
-from bookfinder.adapters.abebooks import AbeBooksAdapter
-from bookfinder.adapters.gutenberg import GutenbergAdapter
-from bookfinder.adapters.hpb import HPBAdapter
-from bookfinder.adapters.openlibrary import OpenLibraryAdapter
-from bookfinder.adapters.pangobooks import PangoBooksAdapter
-from bookfinder.adapters.thriftbooks import ThriftBooksAdapter
-from bookfinder.adapters.worldofbooks import WorldOfBooksAdapter
-
-# Built-in adapters
-_BUILTIN_ADAPTERS: list[BaseAdapter] = [
-    AbeBooksAdapter(),
-    ThriftBooksAdapter(),
-    HPBAdapter(),
-    PangoBooksAdapter(),
-    WorldOfBooksAdapter(),
-    OpenLibraryAdapter(),
-    GutenbergAdapter(),
+import functools
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bookfinder.adapters.base import BaseAdapter
+
+# Built-in adapters as (module, class) pairs, imported on first use so that
+# importing the registry doesn't drag in httpx/bs4/lxml/playwright.
+_BUILTIN_ADAPTERS: list[tuple[str, str]] = [
+    ("bookfinder.adapters.abebooks", "AbeBooksAdapter"),
+    ("bookfinder.adapters.thriftbooks", "ThriftBooksAdapter"),
+    ("bookfinder.adapters.hpb", "HPBAdapter"),
+    ("bookfinder.adapters.pangobooks", "PangoBooksAdapter"),
+    ("bookfinder.adapters.worldofbooks", "WorldOfBooksAdapter"),
+    ("bookfinder.adapters.openlibrary", "OpenLibraryAdapter"),
+    ("bookfinder.adapters.gutenberg", "GutenbergAdapter"),
 ]
 
-_custom_adapters: list[BaseAdapter] = []
+_custom_adapters: list["BaseAdapter"] = []
 
 
-def get_all_adapters() -> list[BaseAdapter]:
-    """Return all registered adapters (built-in + custom)."""
-    return _BUILTIN_ADAPTERS + _custom_adapters
+@functools.cache
+def get_all_adapters() -> list["BaseAdapter"]:
+    """Return all registered adapters (built-in + custom).
+
+    The list is built once and shared between callers; don't mutate it.
+    """
+    builtins = [
+        getattr(importlib.import_module(module), cls)()
+        for module, cls in _BUILTIN_ADAPTERS
+    ]
+    return builtins + _custom_adapters
 
 
 def register_generic(name: str, base_url: str, search_url_template: str) -> None:
     """Register a generic structured-data adapter."""
+    from bookfinder.adapters.generic import GenericAdapter
+
     _custom_adapters.append(GenericAdapter(name, base_url, search_url_template))
+    get_all_adapters.cache_clear()
+
+
+async def shutdown() -> None:
+    """Release network resources shared by the adapters."""
+    from bookfinder.adapters import _browser, _http
+
+    await _http.aclose()
+    await _browser.shutdown()
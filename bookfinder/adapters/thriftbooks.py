@@ -5,10 +5,13 @@ from bs4 import BeautifulSoup
 
 from bookfinder.adapters.base import BaseAdapter
 from bookfinder.models import BookQuery, BookResult, Condition
-from bookfinder.utils.parsing import parse_condition, parse_price
+from bookfinder.utils.parsing import clean_text, parse_condition, parse_price
 
 SEARCH_URL = "https://www.thriftbooks.com/browse/"
 
+_COND_ROW_RE = re.compile(r"Condition:\s*(\w[\w\s]*?)(?:$|Format|List|Save)")
+_BY_RE = re.compile(r"^By\s*")
+
 
 class ThriftBooksAdapter(BaseAdapter):
     @property
@@ -22,29 +25,28 @@ class ThriftBooksAdapter(BaseAdapter):
     async def search(self, query: BookQuery) -> list[BookResult]:
         search_term = query.isbn if query.isbn else query.query
         params = {"b.search": search_term}
-        html = await self._fetch_html(SEARCH_URL, params=params)
-        return self._parse(html)
+        return await self._fetch_parsed(SEARCH_URL, params, self._parse)
 
     def _parse(self, html: str) -> list[BookResult]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         results: list[BookResult] = []
 
         # Result tiles
-        for tile in soup.find_all(class_=re.compile(r"AllEditionsItem-tile")):
+        for tile in soup.select("[class*='AllEditionsItem-tile']"):
             # Title
-            title_el = tile.find(class_=re.compile(r"AllEditionsItem-tileTitle"))
-            title = title_el.get_text(strip=True) if title_el else ""
+            title_el = tile.select_one("[class*='AllEditionsItem-tileTitle']")
+            title = clean_text(title_el) if title_el else ""
             if not title:
                 continue
 
             # Author
-            author_el = tile.find(class_=re.compile(r"SearchResultListItem-subheading"))
+            author_el = tile.select_one("[class*='SearchResultListItem-subheading']")
             author = ""
             if author_el:
-                author = re.sub(r"^By\s*", "", author_el.get_text(strip=True))
+                author = _BY_RE.sub("", clean_text(author_el))
 
             # Price/condition/format
-            row = tile.find(class_=re.compile(r"SearchResultTileItem-rowWrapper"))
+            row = tile.select_one("[class*='SearchResultTileItem-rowWrapper']")
             price = 0.0
             condition = Condition.USED
             if row:
@@ -59,7 +61,7 @@ class ThriftBooksAdapter(BaseAdapter):
                 price = parse_price(row_text)
 
                 # Condition
-                cond_match = re.search(r"Condition:\s*(\w[\w\s]*?)(?:$|Format|List|Save)", row_text)
+                cond_match = _COND_ROW_RE.search(row_text)
                 if cond_match:
                     condition = parse_condition(cond_match.group(1).strip())
 
@@ -67,17 +69,16 @@ class ThriftBooksAdapter(BaseAdapter):
                 continue
 
             # Link
-            link = tile.find("a", href=re.compile(r"/w/"))
+            link = tile.select_one("a[href*='/w/']")
             href = str(link.get("href", "")) if link else ""
             url = href if href.startswith("http") else f"https://www.thriftbooks.com{href}"
-            url = url.split("#")[0].split("?")[0] # Clean tracking
+            url = url.partition("#")[0].partition("?")[0] # Clean tracking
 
             results.append(
                 BookResult(
                     title=title,
                     author=author or "Unknown",
                     price=price,
-                    currency="USD",
                     condition=condition,
                     source=self.name,
                     url=url,
@@ -1,19 +1,46 @@
 """Command-line interface using Click + Rich."""
 
 import asyncio
+import logging
+import sys
 from typing import Optional
 
 import click
 from rich.console import Console
 from rich.table import Table
 
-from bookfinder.adapters.registry import register_generic
+from bookfinder.adapters.registry import get_all_adapters, register_generic, shutdown
 from bookfinder.config import load_config
 from bookfinder.db.database import PriceDatabase
-from bookfinder.models import BookQuery
+from bookfinder.models import BookQuery, BookResult
 from bookfinder.search import search_all_with_report
 
 console = Console()
+# Diagnostics when stdout is piped, so they stay out of the tab-separated output
+err_console = Console(stderr=True)
+
+# uvloop ships no Windows build; fall back to the stock loop there
+_UVLOOP_AVAILABLE = False
+if sys.platform != "win32":
+    try:
+        import uvloop
+        _UVLOOP_AVAILABLE = True
+    except ImportError:
+        pass
+
+
+def _run(coro):
+    """Run a coroutine, releasing shared adapter resources before the loop closes."""
+
+    async def _wrapped():
+        try:
+            return await coro
+        finally:
+            await shutdown()
+
+    if _UVLOOP_AVAILABLE:
+        return uvloop.run(_wrapped())
+    return asyncio.run(_wrapped())
 
 
 def _setup_custom_sites() -> None:
@@ -26,6 +53,8 @@ def _setup_custom_sites() -> None:
 @click.group()
 def main():
     """BookPriceFinder — find the cheapest books across multiple sites."""
+    # Adapter failures are logged lazily; show warnings and up on stderr
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
     _setup_custom_sites()
 
 
@@ -53,32 +82,35 @@ def search(
         max_results = load_config().max_results
 
     book_query = BookQuery(query=query, isbn=isbn, max_results=max_results)
+    notes = console if console.is_terminal else err_console
 
     adapters = None
     if sources:
-        from bookfinder.adapters.registry import get_all_adapters
-        wanted = {s.strip().lower() for s in sources.split(",") if s.strip()}
-        all_adapters = get_all_adapters()
-        adapters = [a for a in all_adapters if a.name.lower() in wanted]
-        
+        wanted = dict.fromkeys(s.strip().lower() for s in sources.split(",") if s.strip())
+        by_name = {a.name.lower(): a for a in get_all_adapters()}
+        adapters = [by_name[w] for w in wanted if w in by_name]
+        missing = wanted.keys() - by_name.keys()
+        if missing:
+            notes.print(f"[yellow]Unknown sources: {', '.join(sorted(missing))}[/yellow]")
+
     if offline:
         with PriceDatabase() as db:
             results = db.get_price_history(isbn=isbn, title=query, limit=max_results)
     else:
-        with console.status("Searching..."):
+        with notes.status("Searching..."):
             with PriceDatabase() as db:
                 # Use db logging for health
-                report = asyncio.run(search_all_with_report(book_query, adapters=adapters, health_logger=db.log_scraper_health))
+                report = _run(search_all_with_report(book_query, adapters=adapters, health_logger=db.log_scraper_health))
                 results = report.results
 
     # Filters
-    if min_price is not None:
-        results = [r for r in results if r.total_price >= min_price]
-    if max_price is not None:
-        results = [r for r in results if r.total_price <= max_price]
+    if min_price is not None or max_price is not None:
+        lo = min_price if min_price is not None else float("-inf")
+        hi = max_price if max_price is not None else float("inf")
+        results = [r for r in results if lo <= r.total_price <= hi]
 
     if not results:
-        console.print("[yellow]No results found.[/yellow]")
+        notes.print("[yellow]No results found.[/yellow]")
         return
 
     # Process results (save and check deals)
@@ -87,7 +119,17 @@ def search(
             db.save_results(results)
             deals = db.check_wishlist_deals(results)
             for entry, res in deals:
-                console.print(f"[bold green]DEAL![/bold green] '{res.title}' for ${res.total_price:.2f} (Wishlist limit: ${entry.max_price:.2f})")
+                notes.print(f"[bold green]DEAL![/bold green] '{res.title}' for ${res.total_price:.2f} (Wishlist limit: ${entry.max_price:.2f})")
+
+    # Piped output: plain tab-separated lines, skipping Rich's layout entirely
+    if not console.is_terminal:
+        sys.stdout.writelines(
+            "\t".join(
+                _tsv_field(f) for f in (r.source, r.title, r.author, _price_str(r), r.condition.value, r.url)
+            ) + "\n"
+            for r in results
+        )
+        return
 
     # Output table
     table = Table(title=f"Results: {query}", show_lines=True)
@@ -99,22 +141,32 @@ def search(
     table.add_column("URL", style="blue", max_width=50)
 
     for r in results:
-        price_str = f"${r.total_price:.2f}" if r.price > 0 else "Free/Lend"
-        table.add_row(r.source, r.title, r.author, price_str, r.condition.value, r.url)
+        table.add_row(r.source, r.title, r.author, _price_str(r), r.condition.value, r.url)
 
     console.print(table)
 
 
+def _price_str(r: BookResult) -> str:
+    return f"${r.total_price:.2f}" if r.price > 0 else "Free/Lend"
+
+
+_TSV_BREAKS = str.maketrans({"\t": " ", "\r": " ", "\n": " "})
+
+
+def _tsv_field(value: str) -> str:
+    """Flatten tabs and line breaks so a field can't split a TSV row."""
+    return value.translate(_TSV_BREAKS)
+
+
 @main.command()
 def sources():
     """List and check availability of all sources."""
-    from bookfinder.adapters.registry import get_all_adapters
     adapters = get_all_adapters()
 
     async def _check():
         return await asyncio.gather(*[a.is_available() for a in adapters])
 
-    availability = asyncio.run(_check())
+    availability = _run(_check())
     table = Table(title="Book Sources")
     table.add_column("Name", style="cyan")
     table.add_column("URL", style="blue")
@@ -132,29 +184,41 @@ def sources():
 def export(path: str, format: str, query: str):
     """Export history to CSV or JSON."""
     with PriceDatabase() as db:
-        rows = db.get_price_history(title=query, limit=1000)
-
-    if not rows:
+        if format == "csv":
+            count = _export_csv(db, path, query)
+        else:
+            rows = db.get_price_history(title=query, limit=1000)
+            count = len(rows)
+            if rows:
+                import json
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump([r.model_dump(mode='json') for r in rows], f, indent=2)
+
+    if not count:
         console.print("[yellow]No data to export.[/yellow]")
         return
 
-    if format == "csv":
-        import csv
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            # Pydantic models to dict for csv
-            data = [r.model_dump() for r in rows]
-            # Flatten condition enum
-            for d in data:
-                d["condition"] = d["condition"]
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
-    else:
-        import json
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump([r.model_dump(mode='json') for r in rows], f, indent=2)
+    console.print(f"[green]Exported {count} items to {path}[/green]")
+
+
+def _export_csv(db: PriceDatabase, path: str, query: str) -> int:
+    """Stream history rows straight from the cursor into a CSV file."""
+    import csv
+
+    rows = db.iter_price_history(title=query, limit=1000)
+    first = next(rows, None)
+    if first is None:
+        return 0
 
-    console.print(f"[green]Exported {len(rows)} items to {path}[/green]")
+    count = 1
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(first))
+        writer.writeheader()
+        writer.writerow(first)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
 
 
 @main.command()
@@ -174,7 +238,15 @@ def web(host: str, port: int, reload: bool):
     """Start the Web UI."""
     try:
         import uvicorn
-        uvicorn.run("bookfinder.web.main:app", host=host, port=port, reload=reload)
+        # Templates are not auto-reloaded, so watch them alongside the code
+        reload_includes = ["*.html"] if reload else None
+        uvicorn.run(
+            "bookfinder.web.main:app",
+            host=host,
+            port=port,
+            reload=reload,
+            reload_includes=reload_includes,
+        )
     except ImportError:
         console.print("[red]Install 'web' extras: pip install bookpricefinder[web][/red]")
 
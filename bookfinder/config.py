@@ -1,5 +1,6 @@
 """User configuration loaded from a TOML file."""
 
+import functools
 import tomllib
 from pathlib import Path
 from pydantic import BaseModel, Field
@@ -21,11 +22,18 @@ class SiteConfig(BaseModel):
 class Config(BaseModel):
     currency: str = "USD"
     max_results: int = 10
+    # Seconds to wait on a single adapter before giving up on it
+    timeout: float = 10.0
     custom_sites: list[SiteConfig] = Field(default_factory=list)
 
 
+@functools.lru_cache(maxsize=4)
 def load_config(path: Path | None = None) -> Config:
-    """Load config from TOML file, falling back to defaults."""
+    """Load config from TOML file, falling back to defaults.
+
+    Parsed once per path per process; call ``load_config.cache_clear()``
+    after changing the file.
+    """
     path = path or DEFAULT_CONFIG_PATH
 
     if not path.exists():
@@ -46,6 +54,7 @@ def load_config(path: Path | None = None) -> Config:
     return Config(
         currency=data.get("currency", "USD"),
         max_results=data.get("max_results", 10),
+        timeout=data.get("timeout", 10.0),
         custom_sites=custom_sites,
     )
 
@@ -72,4 +81,5 @@ def write_default_config(path: Path | None = None, force: bool = False) -> Path:
         content = "# BookPriceFinder configuration\n"
 
     path.write_text(content, encoding="utf-8")
+    load_config.cache_clear()
     return path
@@ -1,9 +1,12 @@
 """SQLite database for price history tracking and wishlists."""
 
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import orjson
 from platformdirs import user_data_dir
 
 from bookfinder.models import (
@@ -27,11 +30,15 @@ CREATE TABLE IF NOT EXISTS price_history (
     condition TEXT,
     source TEXT NOT NULL,
     url TEXT,
-    searched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    searched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    total_price REAL GENERATED ALWAYS AS (price + COALESCE(shipping, 0)) VIRTUAL
 );
 
-CREATE INDEX IF NOT EXISTS idx_price_isbn ON price_history(isbn);
-CREATE INDEX IF NOT EXISTS idx_price_title ON price_history(title);
+-- Composite indexes serve "WHERE x = ? ORDER BY searched_at DESC" without a sort
+DROP INDEX IF EXISTS idx_price_isbn;
+DROP INDEX IF EXISTS idx_price_title;
+CREATE INDEX IF NOT EXISTS idx_price_isbn_time ON price_history(isbn, searched_at DESC);
+CREATE INDEX IF NOT EXISTS idx_price_title_time ON price_history(title, searched_at DESC);
 CREATE INDEX IF NOT EXISTS idx_price_searched_at ON price_history(searched_at);
 
 CREATE TABLE IF NOT EXISTS wishlist (
@@ -67,13 +74,114 @@ CREATE INDEX IF NOT EXISTS idx_health_searched_at ON scraper_health(searched_at)
 """
 
 
+# One price_history row per listing, price and day; repeat searches collapse
+# into it. Title and URL are part of the key because many results carry no ISBN.
+_DEDUPE_KEY = "source, isbn, title, url, price, COALESCE(shipping, 0), DATE(searched_at)"
+
+# Columns read back into BookResult, in the order _row_to_book_result unpacks them
+_RESULT_COLUMNS = "title, author, price, shipping, currency, condition, source, url, isbn, searched_at"
+
+
+def _history_queries(columns: str) -> tuple[str, str, str]:
+    """Price history SELECTs by ISBN, by title/author, and unfiltered."""
+    return (
+        f"SELECT {columns} FROM price_history WHERE isbn = ? ORDER BY searched_at DESC LIMIT ?",
+        (
+            f"SELECT {columns} FROM price_history WHERE title LIKE ? OR author LIKE ? "
+            "ORDER BY searched_at DESC LIMIT ?"
+        ),
+        f"SELECT {columns} FROM price_history ORDER BY searched_at DESC LIMIT ?",
+    )
+
+
+# Built once so hot paths pass sqlite3 the same SQL text on every call
+_HISTORY_ALL = _history_queries("*")
+_HISTORY_RESULTS = _history_queries(_RESULT_COLUMNS)
+
+_AVG_PRICE_BY_ISBN = (
+    "SELECT AVG(total_price) AS avg_price FROM price_history WHERE isbn = ? AND price > 0"
+)
+_AVG_PRICE_BY_TITLE = (
+    "SELECT AVG(total_price) AS avg_price FROM price_history WHERE title LIKE ? AND price > 0"
+)
+
+_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-20000;
+"""
+
+# Database files whose schema has already been applied in this process
+_SCHEMA_APPLIED: set[Path] = set()
+
+
 class PriceDatabase:
     def __init__(self, db_path: Path | None = None):
         self.db_path = db_path or DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(self.db_path))
+        # Autocommit mode: the driver never opens transactions implicitly;
+        # writes go through _transaction() instead
+        self._conn = sqlite3.connect(str(self.db_path), isolation_level=None)
         self._conn.row_factory = sqlite3.Row
-        self._conn.executescript(_SCHEMA)
+        self._conn.executescript(_PRAGMAS)
+
+        resolved = self.db_path.resolve()
+        had_indexes = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_price_isbn_time'"
+        ).fetchone()
+        # Re-checked on every open: the file may have been deleted or replaced
+        # since the schema was last applied
+        if resolved not in _SCHEMA_APPLIED or not had_indexes:
+            self._conn.executescript(_SCHEMA)
+            self._migrate_total_price()
+            self._migrate_dedupe_index()
+            if not had_indexes:
+                # Give the planner statistics for the new indexes
+                self._conn.execute("ANALYZE")
+            _SCHEMA_APPLIED.add(resolved)
+
+    def _migrate_total_price(self) -> None:
+        """Add the generated total_price column to databases created before it existed."""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_xinfo(price_history)")}
+        if "total_price" not in columns:
+            self._conn.execute(
+                "ALTER TABLE price_history ADD COLUMN total_price REAL "
+                "GENERATED ALWAYS AS (price + COALESCE(shipping, 0)) VIRTUAL"
+            )
+        # Partial index: only priced rows ever feed price aggregates
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_price_isbn_total "
+            "ON price_history(isbn, total_price) WHERE price > 0"
+        )
+
+    def _migrate_dedupe_index(self) -> None:
+        """Create the unique dedupe index, dropping duplicates that predate it."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_price_dedupe'"
+        ).fetchone()
+        if exists:
+            return
+        with self._transaction():
+            self._conn.execute(
+                "DELETE FROM price_history WHERE id NOT IN "
+                f"(SELECT MIN(id) FROM price_history GROUP BY {_DEDUPE_KEY})"
+            )
+            self._conn.execute(
+                f"CREATE UNIQUE INDEX idx_price_dedupe ON price_history({_DEDUPE_KEY})"
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run a batch of writes in one BEGIN IMMEDIATE ... COMMIT block."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
 
     def close(self):
         self._conn.close()
@@ -85,17 +193,20 @@ class PriceDatabase:
         self.close()
 
     def _row_to_book_result(self, row: sqlite3.Row) -> BookResult:
+        # Positional unpack of a _RESULT_COLUMNS row: one tuple walk instead
+        # of a name lookup per column
+        title, author, price, shipping, currency, condition, source, url, isbn, searched_at = row
         return BookResult(
-            title=row["title"],
-            author=row["author"] or "Unknown",
-            price=row["price"],
-            currency=row["currency"],
-            condition=Condition(row["condition"] or "unknown"),
-            source=row["source"],
-            url=row["url"],
-            isbn=row["isbn"] or "",
-            shipping=row["shipping"],
-            searched_at=row["searched_at"],
+            title=title,
+            author=author or "Unknown",
+            price=price,
+            currency=currency,
+            condition=Condition(condition) if condition else Condition.UNKNOWN,
+            source=source,
+            url=url,
+            isbn=isbn or "",
+            shipping=shipping,
+            searched_at=searched_at,
         )
 
     def _row_to_wishlist_entry(self, row: sqlite3.Row) -> WishlistEntry:
@@ -111,8 +222,12 @@ class PriceDatabase:
     # ── Price History ──
 
     def save_results(self, results: list[BookResult]) -> int:
-        """Save search results to price history."""
-        rows = [
+        """Save search results to price history.
+
+        Rows already recorded today for the same listing and price are
+        skipped; returns the number of rows actually inserted.
+        """
+        rows = (
             (
                 r.isbn,
                 r.title,
@@ -125,53 +240,50 @@ class PriceDatabase:
                 r.url,
             )
             for r in results
-        ]
-        self._conn.executemany(
-            """INSERT INTO price_history
-               (isbn, title, author, price, shipping, currency, condition, source, url)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            rows,
         )
-        self._conn.commit()
-        return len(rows)
+        with self._transaction():
+            cursor = self._conn.executemany(
+                """INSERT OR IGNORE INTO price_history
+                   (isbn, title, author, price, shipping, currency, condition, source, url)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+        return cursor.rowcount
+
+    def _query_price_history(
+        self, isbn: str, title: str, limit: int, queries: tuple[str, str, str] = _HISTORY_ALL
+    ) -> sqlite3.Cursor:
+        by_isbn, by_title, latest = queries
+        if isbn:
+            return self._conn.execute(by_isbn, (isbn, limit))
+        if title:
+            search_title = f"%{title.replace(' ', '%')}%"
+            return self._conn.execute(by_title, (search_title, search_title, limit))
+        return self._conn.execute(latest, (limit,))
 
     def get_price_history(
         self, isbn: str = "", title: str = "", limit: int = 50
     ) -> list[BookResult]:
         """Get price history for a book by ISBN or title."""
-        if isbn:
-            cursor = self._conn.execute(
-                "SELECT * FROM price_history WHERE isbn = ? ORDER BY searched_at DESC LIMIT ?",
-                (isbn, limit),
-            )
-        elif title:
-            search_title = f"%{title.replace(' ', '%')}%"
-            cursor = self._conn.execute(
-                """SELECT * FROM price_history
-                   WHERE title LIKE ? OR author LIKE ? 
-                   ORDER BY searched_at DESC LIMIT ?""",
-                (search_title, search_title, limit),
-            )
-        else:
-            cursor = self._conn.execute(
-                "SELECT * FROM price_history ORDER BY searched_at DESC LIMIT ?",
-                (limit,),
-            )
-        return [self._row_to_book_result(row) for row in cursor.fetchall()]
+        cursor = self._query_price_history(isbn, title, limit, _HISTORY_RESULTS)
+        to_result = self._row_to_book_result
+        return [to_result(row) for row in cursor]
+
+    def iter_price_history(
+        self, isbn: str = "", title: str = "", limit: int = 50
+    ) -> Iterator[dict[str, Any]]:
+        """Yield raw price history rows as dicts without loading them all at once."""
+        for row in self._query_price_history(isbn, title, limit):
+            yield dict(row)
 
     def get_average_price(self, isbn: str = "", title: str = "") -> float | None:
         """Get the average price for a book from history."""
         if isbn:
-            where, param = "isbn = ?", isbn
+            row = self._conn.execute(_AVG_PRICE_BY_ISBN, (isbn,)).fetchone()
         elif title:
-            where, param = "title LIKE ?", f"%{title}%"
+            row = self._conn.execute(_AVG_PRICE_BY_TITLE, (f"%{title}%",)).fetchone()
         else:
             return None
-
-        row = self._conn.execute(
-            f"SELECT AVG(price + COALESCE(shipping, 0)) as avg_price FROM price_history WHERE {where} AND price > 0",
-            (param,),
-        ).fetchone()
         return row["avg_price"] if row and row["avg_price"] else None
 
     # ── Wishlist ──
@@ -180,17 +292,17 @@ class PriceDatabase:
         self, title: str, author: str = "", isbn: str = "", max_price: float | None = None
     ) -> int:
         """Add a book to the wishlist."""
-        cursor = self._conn.execute(
-            "INSERT INTO wishlist (title, author, isbn, max_price) VALUES (?, ?, ?, ?)",
-            (title, author, isbn, max_price),
-        )
-        self._conn.commit()
+        with self._transaction():
+            cursor = self._conn.execute(
+                "INSERT INTO wishlist (title, author, isbn, max_price) VALUES (?, ?, ?, ?)",
+                (title, author, isbn, max_price),
+            )
         return cursor.lastrowid or 0
 
     def remove_from_wishlist(self, wishlist_id: int) -> bool:
         """Remove a book from the wishlist by ID."""
-        cursor = self._conn.execute("DELETE FROM wishlist WHERE id = ?", (wishlist_id,))
-        self._conn.commit()
+        with self._transaction():
+            cursor = self._conn.execute("DELETE FROM wishlist WHERE id = ?", (wishlist_id,))
         return cursor.rowcount > 0
 
     def get_wishlist(self) -> list[WishlistEntry]:
@@ -200,17 +312,22 @@ class PriceDatabase:
 
     def check_wishlist_deals(self, results: list[BookResult]) -> list[tuple[WishlistEntry, BookResult]]:
         """Check if any search results match wishlist items under max_price."""
-        wishlist = self.get_wishlist()
+        # Lowercase each title once rather than once per (entry, result) pair
+        tracked = [
+            (entry, entry.title.lower(), entry.max_price)
+            for entry in self.get_wishlist()
+            if entry.max_price is not None
+        ]
         deals = []
-        for entry in wishlist:
-            if entry.max_price is None:
+        for result in results:
+            if result.price <= 0:
                 continue
-            for result in results:
-                if result.price <= 0:
+            title = result.title.lower()
+            total = result.total_price
+            for entry, entry_title, max_price in tracked:
+                if total > max_price:
                     continue
-                isbn_match = entry.isbn and entry.isbn == result.isbn
-                title_match = entry.title.lower() in result.title.lower()
-                if (isbn_match or title_match) and result.total_price <= entry.max_price:
+                if (entry.isbn and entry.isbn == result.isbn) or entry_title in title:
                     deals.append((entry, result))
         return deals
 
@@ -218,12 +335,11 @@ class PriceDatabase:
 
     def save_search(self, name: str, params: dict) -> int:
         """Save a search preset."""
-        import json
-        cursor = self._conn.execute(
-            "INSERT INTO saved_searches (name, params) VALUES (?, ?)",
-            (name, json.dumps(params)),
-        )
-        self._conn.commit()
+        with self._transaction():
+            cursor = self._conn.execute(
+                "INSERT INTO saved_searches (name, params) VALUES (?, ?)",
+                (name, orjson.dumps(params).decode()),
+            )
         return cursor.lastrowid or 0
 
     def list_saved_searches(self) -> list[dict]:
@@ -239,19 +355,19 @@ class PriceDatabase:
 
     def delete_saved_search(self, search_id: int) -> bool:
         """Delete a saved search by ID."""
-        cursor = self._conn.execute("DELETE FROM saved_searches WHERE id = ?", (search_id,))
-        self._conn.commit()
+        with self._transaction():
+            cursor = self._conn.execute("DELETE FROM saved_searches WHERE id = ?", (search_id,))
         return cursor.rowcount > 0
 
     # ── Scraper Health ──
 
     def log_scraper_health(self, source: str, success: bool, error_message: str | None = None) -> None:
         """Log the result of a scraper run."""
-        self._conn.execute(
-            "INSERT INTO scraper_health (source, success, error_message) VALUES (?, ?, ?)",
-            (source, 1 if success else 0, error_message),
-        )
-        self._conn.commit()
+        with self._transaction():
+            self._conn.execute(
+                "INSERT INTO scraper_health (source, success, error_message) VALUES (?, ?, ?)",
+                (source, 1 if success else 0, error_message),
+            )
 
     def get_scraper_health(self, limit_per_source: int = 20) -> list[ScraperHealthEntry]:
         """Get the latest health logs for each source."""
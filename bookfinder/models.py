@@ -1,5 +1,9 @@
 from enum import Enum
 from datetime import datetime
+from functools import cached_property
+from collections.abc import Mapping
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -15,7 +19,9 @@ class BookResult(BaseModel):
     title: str
     author: str
     price: float
-    currency: str
+    # Defaulted rather than passed by every adapter: pydantic skips
+    # validating defaults, which saves work on each constructed result.
+    currency: str = "USD"
     condition: Condition
     source: str
     url: str
@@ -25,10 +31,33 @@ class BookResult(BaseModel):
     deal_score: float | None = None
     searched_at: datetime | None = None
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ("price", "shipping"):
+            self.__dict__.pop("total_price", None)
+        elif name in ("title", "author", "source"):
+            self.__dict__.pop("search_text", None)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> "BookResult":
+        copied = super().model_copy(update=update, deep=deep)
+        # update= writes __dict__ directly, so drop values derived from the old fields
+        if update:
+            copied.__dict__.pop("total_price", None)
+            copied.__dict__.pop("search_text", None)
+        return copied
+
+    # Cached so hot filter/sort paths read a plain attribute; not a field,
+    # so it stays out of model_dump() and is ignored by the constructor
+    @cached_property
     def total_price(self) -> float:
+        """Price including shipping."""
         return self.price + (self.shipping or 0.0)
 
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased title, author and source, for substring filtering."""
+        return f"{self.title} {self.author} {self.source}".lower()
+
 
 class BookQuery(BaseModel):
     """What the user is searching for."""
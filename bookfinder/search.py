@@ -3,38 +3,73 @@
 import asyncio
 import logging
 import time
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-from bookfinder.adapters.base import BaseAdapter
 from bookfinder.adapters.registry import get_all_adapters
+from bookfinder.config import load_config
 from bookfinder.models import BookQuery, BookResult, SearchReport
 
+if TYPE_CHECKING:
+    from bookfinder.adapters.base import BaseAdapter
+
 log = logging.getLogger(__name__)
 
 # Type for health logging callback
 HealthLogger = Callable[[str, bool, Optional[str]], None]
 
+# Upper bound on adapters searching at once; custom sites can push the
+# adapter count well past the built-in seven
+MAX_CONCURRENT_SEARCHES = 8
+
+
+def _sorted_by_price(results: list[BookResult]) -> list[BookResult]:
+    """Order by total price, with zero-priced (free/lending) results last."""
+    # Decorate-sort-undecorate: build each key once in a comprehension rather
+    # than through a per-item lambda; the index breaks ties so BookResults
+    # themselves are never compared.
+    keyed = [
+        (r.price == 0, r.price + (r.shipping or 0.0), i, r)
+        for i, r in enumerate(results)
+    ]
+    keyed.sort()
+    return [k[-1] for k in keyed]
+
 
 async def search_all_with_report(
     query: BookQuery,
-    adapters: list[BaseAdapter] | None = None,
+    adapters: "list[BaseAdapter] | None" = None,
     health_logger: HealthLogger | None = None,
+    timeout: float | None = None,
 ) -> SearchReport:
-    """Search all adapters and return results with per-source status."""
+    """Search all adapters and return results with per-source status.
+
+    Each adapter gets ``timeout`` seconds (the config value by default), or
+    its own ``min_timeout`` if that is longer; one that runs over is reported
+    as an error and not retried.
+    """
     adapters = adapters or get_all_adapters()
+    if timeout is None:
+        timeout = load_config().timeout
     report = SearchReport()
     start = time.monotonic()
+    sem = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
 
-    async def _safe_search(adapter: BaseAdapter) -> list[BookResult]:
+    async def _safe_search(adapter: "BaseAdapter") -> list[BookResult]:
         retries = 2
         last_error = ""
+        limit = max(timeout, adapter.min_timeout)
         for i in range(retries + 1):
             try:
-                results = await adapter.search(query)
+                async with sem:
+                    results = await asyncio.wait_for(adapter.search(query), limit)
                 report.source_counts[adapter.name] = len(results)
                 if health_logger:
                     health_logger(adapter.name, True, None)
                 return results
+            except TimeoutError:
+                last_error = f"timed out after {limit:g}s"
+                log.warning("%s %s", adapter.name, last_error)
+                break
             except Exception as e:
                 last_error = str(e)
                 if i < retries:
@@ -48,14 +83,43 @@ async def search_all_with_report(
             health_logger(adapter.name, False, last_error)
         return []
 
-    tasks = [_safe_search(a) for a in adapters]
-    nested = await asyncio.gather(*tasks)
+    # Collect each batch as soon as its adapter finishes instead of holding
+    # everything until the slowest one returns
+    results: list[BookResult] = []
+    for next_batch in asyncio.as_completed([_safe_search(a) for a in adapters]):
+        results.extend(await next_batch)
 
-    # Flatten results
-    report.results = [r for batch in nested for r in batch]
-    
-    # Sort: prices with 0 at the end, then by total price
-    report.results.sort(key=lambda r: (r.price == 0, r.total_price))
+    report.results = _sorted_by_price(results)
     
     report.elapsed = time.monotonic() - start
     return report
+
+
+async def search_all(
+    query: BookQuery,
+    adapters: "list[BaseAdapter] | None" = None,
+    timeout: float = 20.0,
+) -> list[BookResult]:
+    """Search all adapters concurrently and return the merged, sorted results.
+
+    Adapters that raise or run past ``timeout`` seconds (or their own
+    ``min_timeout``, if longer) are skipped.
+    """
+    adapters = adapters or get_all_adapters()
+    sem = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+
+    async def _bounded(adapter: "BaseAdapter") -> list[BookResult]:
+        # The timeout starts once the adapter runs, not while it waits for a slot
+        async with sem:
+            return await asyncio.wait_for(adapter.search(query), max(timeout, adapter.min_timeout))
+
+    batches = await asyncio.gather(*(_bounded(a) for a in adapters), return_exceptions=True)
+
+    results: list[BookResult] = []
+    for adapter, batch in zip(adapters, batches, strict=True):
+        if isinstance(batch, BaseException):
+            log.warning("%s failed: %r", adapter.name, batch)
+            continue
+        results.extend(batch)
+
+    return _sorted_by_price(results)
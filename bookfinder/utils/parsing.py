@@ -1,18 +1,39 @@
 import re
 import logging
+
+from bs4 import Tag
+
 from bookfinder.models import Condition
 
 log = logging.getLogger(__name__)
 
+_DOLLAR_RE = re.compile(r"(?:US\$|\$)\s*([\d.]+)")
+_SHIP_RE = re.compile(r"([\d.]+)\s*shipping")
+
 def parse_price(text: str) -> float:
     """Extract numeric price from string (e.g. '$12.99' -> 12.99)."""
     if not text:
         return 0.0
-    # Remove commas and handle multiple currency symbols
-    cleaned = text.replace(",", "")
-    match = re.search(r"[\d,]+\.?\d*", cleaned)
+    # Single scan: skip to the first digit, then take digits/commas and one dot
+    start = -1
+    for i, c in enumerate(text):
+        if c.isdigit():
+            start = i
+            break
+    if start < 0:
+        return 0.0
+    end = start
+    seen_dot = False
+    for c in text[start:]:
+        if c.isdigit() or c == ",":
+            end += 1
+        elif c == "." and not seen_dot:
+            seen_dot = True
+            end += 1
+        else:
+            break
     try:
-        return float(match.group()) if match else 0.0
+        return float(text[start:end].replace(",", ""))
     except ValueError:
         return 0.0
 
@@ -36,12 +57,33 @@ def parse_shipping(text: str) -> float | None:
         return 0.0
     
     # Try to find currency-prefixed price
-    match = re.search(r"(?:US\$|\$)\s*([\d.]+)", text)
+    match = _DOLLAR_RE.search(text)
     if not match:
         # Fallback to just digits
-        match = re.search(r"([\d.]+)\s*shipping", text_lower)
+        match = _SHIP_RE.search(text_lower)
     
     try:
         return float(match.group(1)) if match else None
     except (ValueError, IndexError):
         return None
+
+def clean_text(el: Tag) -> str:
+    """Element text with whitespace runs collapsed to single spaces.
+
+    One pass over the subtree; cheaper than ``get_text(strip=True)``, which
+    strips every text node separately (and glues adjacent words together).
+    """
+    return " ".join(el.get_text().split())
+
+
+def select_first(el: Tag, selectors: tuple[str, ...]) -> list[Tag]:
+    """Matches for the first selector, in priority order, that finds anything.
+
+    Broad fallbacks must not run alongside the specific selectors: they also
+    match wrappers around the real cards.
+    """
+    for selector in selectors:
+        found = el.select(selector)
+        if found:
+            return found
+    return []
@@ -1,9 +1,8 @@
-import csv
-import io
-import json
 import logging
 import time
 from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Optional, TypedDict
 from urllib.parse import urlencode
@@ -13,14 +12,16 @@ from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Stre
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from currency_converter import CurrencyConverter
+from jinja2 import Environment, FileSystemLoader
+import orjson
 
+from bookfinder.adapters.registry import shutdown
 from bookfinder.db.database import PriceDatabase
 from bookfinder.web.utils import (
-    apply_filters,
-    apply_sort,
     bool_value,
     cached_search,
     compare_lowest_per_source,
+    filter_and_sort,
     looks_like_isbn,
     paginate,
     get_book_cover_url,
@@ -29,11 +30,26 @@ from bookfinder.models import SearchReport, BookResult
 
 log = logging.getLogger(__name__)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    await shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 BASE_DIR = Path(__file__).resolve().parent
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+# Templates are compiled once and never re-checked against the filesystem;
+# `bookfinder web --reload` restarts the server when they change instead.
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader(BASE_DIR / "templates"),
+        autoescape=True,
+        auto_reload=False,
+    )
+)
 
 # Strict types for context
 class ContextDict(TypedDict, total=False):
@@ -55,6 +71,7 @@ class ContextDict(TypedDict, total=False):
     total_results: int
     total_pages: int
     current_page: int
+    page_query: str
     compare_results: list[BookResult]
     sources: list[str]
     report: SearchReport
@@ -72,8 +89,26 @@ try:
 except Exception as e:
     log.warning("Could not initialize currency converter: %s", e)
 
+# Saved searches appear in every page's sidebar; keep them briefly so most
+# renders skip the database. Writes through this app clear it immediately.
+_SAVED_SEARCHES_TTL = 10.0
+_SAVED_SEARCHES: Optional[tuple[float, list[dict[str, Any]]]] = None
+
 _RATE_LIMIT_SECONDS = 5
-_LAST_SEARCH: dict[str, float] = defaultdict(float)
+_LAST_SEARCH: dict[str, float] = {}
+# Drop expired client entries every this many searches so the map stays bounded
+_LAST_SEARCH_SWEEP_EVERY = 256
+_last_search_writes = 0
+
+
+def _record_search(client_ip: str, now: float) -> None:
+    global _last_search_writes
+    _LAST_SEARCH[client_ip] = now
+    _last_search_writes += 1
+    if _last_search_writes % _LAST_SEARCH_SWEEP_EVERY == 0:
+        cutoff = now - _RATE_LIMIT_SECONDS * 4
+        for ip in [ip for ip, ts in _LAST_SEARCH.items() if ts <= cutoff]:
+            del _LAST_SEARCH[ip]
 
 
 @app.get("/health")
@@ -81,10 +116,24 @@ async def health() -> JSONResponse:
     return JSONResponse({"status": "ok"})
 
 
-async def get_common_context(db: PriceDatabase, request: Request) -> ContextDict:
+def _saved_searches() -> list[dict[str, Any]]:
+    global _SAVED_SEARCHES
+    now = time.monotonic()
+    if _SAVED_SEARCHES is None or now - _SAVED_SEARCHES[0] >= _SAVED_SEARCHES_TTL:
+        with PriceDatabase() as db:
+            _SAVED_SEARCHES = (now, db.list_saved_searches())
+    return _SAVED_SEARCHES[1]
+
+
+def _invalidate_saved_searches() -> None:
+    global _SAVED_SEARCHES
+    _SAVED_SEARCHES = None
+
+
+async def get_common_context(request: Request) -> ContextDict:
     currency = request.cookies.get("bpf_currency", "USD")
     return {
-        "saved_searches": db.list_saved_searches(),
+        "saved_searches": _saved_searches(),
         "display_currency": currency,
         "available_currencies": ["USD", "GBP", "EUR", "CAD", "AUD", "JPY"] if converter else ["USD"],
     }
@@ -102,8 +151,7 @@ def convert_price(price: float, from_curr: str, to_curr: str) -> float:
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request) -> HTMLResponse:
-    with PriceDatabase() as db:
-        context = await get_common_context(db, request)
+    context = await get_common_context(request)
     return templates.TemplateResponse(request, "index.html", context)  # type: ignore
 
 
@@ -122,7 +170,7 @@ async def search_get(
     page: int = Query(1),
 ) -> HTMLResponse:
     with PriceDatabase() as db:
-        context = await get_common_context(db, request)
+        context = await get_common_context(request)
         
         context.update({
             "query": query,
@@ -142,15 +190,15 @@ async def search_get(
         # Rate limiting
         client_ip = request.client.host if request.client else "unknown"
         now = time.time()
-        if now - _LAST_SEARCH[client_ip] < _RATE_LIMIT_SECONDS:
+        if now - _LAST_SEARCH.get(client_ip, 0.0) < _RATE_LIMIT_SECONDS:
             context["error"] = "Please wait a few seconds."
             return templates.TemplateResponse(request, "results.html", {**context, "page_results": []})  # type: ignore
-        _LAST_SEARCH[client_ip] = now
+        _record_search(client_ip, now)
 
         isbn_flag = bool(context.get("isbn_only"))
         report = await cached_search(query, max_results, isbn_flag, db=db)
-        results = report.results
-        available_sources = sorted({r.source for r in results})
+        # Every source that answered, read from the report rather than a scan of the results
+        available_sources = sorted(report.source_counts)
 
         def _to_float(v: Optional[str]) -> Optional[float]:
             try:
@@ -158,8 +206,8 @@ async def search_get(
             except ValueError:
                 return None
 
-        filtered = apply_filters(
-            results,
+        sorted_results = filter_and_sort(
+            report,
             filter_text=filter,
             min_price=_to_float(min_price),
             max_price=_to_float(max_price),
@@ -167,17 +215,12 @@ async def search_get(
             selected_sources=sources,
             isbn_only=isbn_flag,
             isbn_query=query,
+            sort_by=sort_by,
+            currency=str(context.get("display_currency", "USD")),
+            convert=convert_price,
         )
-        sorted_results = apply_sort(filtered, sort_by)
-        
-        target_curr = str(context.get("display_currency", "USD"))
+
         for r in sorted_results:
-            if target_curr != r.currency:
-                r.price = convert_price(r.price, r.currency, target_curr)
-                if r.shipping is not None:
-                    r.shipping = convert_price(r.shipping, r.currency, target_curr)
-                r.currency = target_curr
-            
             r.cover_url = get_book_cover_url(r.isbn)
 
             avg = db.get_average_price(isbn=r.isbn, title=r.title if not r.isbn else "")
@@ -188,6 +231,21 @@ async def search_get(
                 r.deal_score = 0.0
 
         page_results, total, total_pages, current_page = paginate(sorted_results, page, 25)
+        # Everything but the page number is shared by all pagination links
+        page_query = urlencode(
+            {
+                "query": query,
+                "max_results": max_results,
+                "sort_by": sort_by,
+                "filter": filter,
+                "min_price": min_price or "",
+                "max_price": max_price or "",
+                "condition": condition,
+                "isbn_only": "1" if isbn_flag else "",
+                "sources": sources,
+            },
+            doseq=True,
+        )
 
         context.update({
             "results": sorted_results,
@@ -195,6 +253,7 @@ async def search_get(
             "total_results": total,
             "total_pages": total_pages,
             "current_page": current_page,
+            "page_query": page_query,
             "compare_results": compare_lowest_per_source(sorted_results),
             "sources": available_sources,
             "report": report,
@@ -239,7 +298,7 @@ async def set_currency(currency: str = Form(...)) -> RedirectResponse:
 @app.get("/status", response_class=HTMLResponse)
 async def status_page(request: Request) -> HTMLResponse:
     with PriceDatabase() as db:
-        context = await get_common_context(db, request)
+        context = await get_common_context(request)
         health_data = db.get_scraper_health()
     
     grouped: dict[str, list[Any]] = defaultdict(list)
@@ -283,6 +342,7 @@ async def save_search(
     }
     with PriceDatabase() as db:
         search_id = db.save_search(name, params)
+    _invalidate_saved_searches()
     return RedirectResponse(url=f"/saved?id={search_id}", status_code=303)
 
 
@@ -292,7 +352,7 @@ async def saved_search(id: int = Query(...)) -> RedirectResponse:
         record = db.get_saved_search(id)
     if not record:
         return RedirectResponse(url="/")
-    params = json.loads(record["params"])
+    params = orjson.loads(record["params"])
     return RedirectResponse(url=f"/search?{urlencode(params, doseq=True)}")
 
 
@@ -300,6 +360,7 @@ async def saved_search(id: int = Query(...)) -> RedirectResponse:
 async def delete_search(saved_id: int = Form(...)) -> RedirectResponse:
     with PriceDatabase() as db:
         db.delete_saved_search(saved_id)
+    _invalidate_saved_searches()
     return RedirectResponse(url="/", status_code=303)
 
 
@@ -324,8 +385,8 @@ async def export(
         except ValueError:
             return None
 
-    filtered = apply_filters(
-        report.results,
+    sorted_results = filter_and_sort(
+        report,
         filter_text=filter,
         min_price=_to_float(min_price),
         max_price=_to_float(max_price),
@@ -333,23 +394,34 @@ async def export(
         selected_sources=sources,
         isbn_only=isbn_flag,
         isbn_query=query,
+        sort_by=sort_by,
     )
-    sorted_results = apply_sort(filtered, sort_by)
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["source", "title", "author", "price", "currency", "condition", "url"])
-    for r in sorted_results:
-        writer.writerow([r.source, r.title, r.author, f"{r.total_price:.2f}", r.currency, r.condition.value, r.url])
 
-    output.seek(0)
     return StreamingResponse(
-        output,
+        _csv_rows(sorted_results),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=bookpricefinder.csv"},
     )
 
 
+def _csv_field(value: str) -> str:
+    """Quote a CSV field the way csv.writer's QUOTE_MINIMAL does."""
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+async def _csv_rows(results: list[BookResult]) -> AsyncIterator[str]:
+    """Yield the export CSV one line at a time."""
+    q = _csv_field
+    yield "source,title,author,price,currency,condition,url\r\n"
+    for r in results:
+        yield (
+            f"{q(r.source)},{q(r.title)},{q(r.author)},{r.total_price:.2f},"
+            f"{q(r.currency)},{r.condition.value},{q(r.url)}\r\n"
+        )
+
+
 @app.get("/wishlist", response_class=HTMLResponse)
 async def wishlist_page(
     request: Request,
@@ -359,7 +431,7 @@ async def wishlist_page(
     add_price: str = Query(""),
 ) -> HTMLResponse:
     with PriceDatabase() as db:
-        context = await get_common_context(db, request)
+        context = await get_common_context(request)
         entries = db.get_wishlist()
     
     context.update({
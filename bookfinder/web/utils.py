@@ -1,7 +1,13 @@
 """Web utilities for search, filtering, and caching."""
 
+import asyncio
 import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import partial
 from math import ceil
+from operator import attrgetter
+from pathlib import Path
 from typing import Optional
 
 from bookfinder.db.database import PriceDatabase
@@ -10,14 +16,25 @@ from bookfinder.search import search_all_with_report
 
 _CACHE_TTL_SECONDS = 300
 _CACHE_MAX_ITEMS = 50
-_CACHE: dict[tuple[str, int, bool], tuple[float, SearchReport]] = {}
+# Least recently used first, so eviction is popitem(last=False)
+_CACHE: OrderedDict[tuple[str, int, bool], tuple[float, SearchReport]] = OrderedDict()
+# Filtered + sorted result lists keyed by (report id, currency, filters,
+# sort), so paging through one search only slices. The report is stored
+# alongside to guard against id() reuse; a report's views are dropped when
+# it leaves _CACHE so they don't keep it alive.
+_VIEWS_MAX_ITEMS = 200
+_VIEWS: OrderedDict[tuple, tuple[SearchReport, list[BookResult]]] = OrderedDict()
+
+# Searches currently running, so concurrent identical requests share one fan-out
+_INFLIGHT: dict[tuple[str, int, bool], "asyncio.Task[SearchReport]"] = {}
+
+
+_TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
 
 
 def bool_value(value: Optional[str]) -> bool:
     """Safely convert string/None to boolean."""
-    if value is None:
-        return False
-    return value.lower() in {"1", "true", "yes", "on"}
+    return value is not None and value.lower() in _TRUE_VALUES
 
 
 def looks_like_isbn(query: str) -> bool:
@@ -35,34 +52,65 @@ def looks_like_isbn(query: str) -> bool:
 async def cached_search(
     query: str, max_results: int, isbn_only: bool, db: Optional[PriceDatabase] = None
 ) -> SearchReport:
-    """Search with local memory cache."""
-    key = (query, max_results, isbn_only)
+    """Search with local memory cache.
+
+    Queries differing only in case or surrounding whitespace share an entry;
+    a blank query returns an empty report without contacting any source.
+    """
+    norm = query.strip().casefold()
+    if not norm:
+        return SearchReport()
+    key = (norm, max_results, isbn_only)
     now = time.time()
     cached = _CACHE.get(key)
-    
-    if cached and now - cached[0] < _CACHE_TTL_SECONDS:
-        return cached[1]
+    if cached:
+        if now - cached[0] < _CACHE_TTL_SECONDS:
+            _CACHE.move_to_end(key)
+            return cached[1]
+        del _CACHE[key]
+        _drop_views(cached[1])
+
+    task = _INFLIGHT.get(key)
+    if task is None:
+        book_query = BookQuery(
+            query="" if isbn_only else query,
+            isbn=query if isbn_only else "",
+            max_results=max_results,
+        )
+        # The search runs as its own task, not inside any one request, so a
+        # caller that disconnects doesn't cancel it for the others waiting
+        task = asyncio.ensure_future(
+            _search_and_store(key, book_query, db.db_path if db else None)
+        )
+        _INFLIGHT[key] = task
+        task.add_done_callback(partial(_forget_inflight, key))
+    return await asyncio.shield(task)
 
-    book_query = BookQuery(
-        query="" if isbn_only else query,
-        isbn=query if isbn_only else "",
-        max_results=max_results,
-    )
-    
-    # Use database logger if available for health tracking
-    logger = db.log_scraper_health if db else None
-    report = await search_all_with_report(book_query, health_logger=logger)
-    
-    _CACHE[key] = (now, report)
 
-    # Prune old cache entries
-    if len(_CACHE) > _CACHE_MAX_ITEMS:
-        oldest_key = min(_CACHE, key=lambda k: _CACHE[k][0])
-        _CACHE.pop(oldest_key, None)
+async def _search_and_store(
+    key: tuple[str, int, bool], book_query: BookQuery, db_path: Optional[Path]
+) -> SearchReport:
+    if db_path is None:
+        report = await search_all_with_report(book_query)
+    else:
+        # Own connection for health logging; the requesting one may close first
+        with PriceDatabase(db_path) as db:
+            report = await search_all_with_report(book_query, health_logger=db.log_scraper_health)
 
+    _CACHE[key] = (time.time(), report)
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > _CACHE_MAX_ITEMS:
+        _drop_views(_CACHE.popitem(last=False)[1][1])
     return report
 
 
+def _forget_inflight(key: tuple[str, int, bool], task: "asyncio.Task[SearchReport]") -> None:
+    if _INFLIGHT.get(key) is task:
+        del _INFLIGHT[key]
+    if not task.cancelled():
+        task.exception()  # Every waiter may have gone; don't warn about it
+
+
 def get_book_cover_url(isbn: Optional[str]) -> Optional[str]:
     """Return Open Library cover URL for an ISBN."""
     if not isbn:
@@ -83,48 +131,111 @@ def apply_filters(
     isbn_only: bool,
     isbn_query: str,
 ) -> list[BookResult]:
-    """Apply search filters to a result list."""
-    filtered = results
+    """Apply search filters to a result list in a single pass."""
+    needle = filter_text.lower() if filter_text else None
+    lo = min_price if min_price is not None else float("-inf")
+    hi = max_price if max_price is not None else float("inf")
+    wanted_sources = set(selected_sources) if selected_sources else None
+    isbn = isbn_query if isbn_only and isbn_query else None
+
+    return [
+        r
+        for r in results
+        if lo <= r.total_price <= hi
+        and (not condition_filter or r.condition.value == condition_filter)
+        and (wanted_sources is None or r.source in wanted_sources)
+        and (isbn is None or r.isbn == isbn)
+        and (needle is None or needle in r.search_text)
+    ]
+
+
+_SORT_KEYS = {
+    "price-asc": (attrgetter("total_price"), False),
+    "price-desc": (attrgetter("total_price"), True),
+    "title-asc": (attrgetter("title"), False),
+    "title-desc": (attrgetter("title"), True),
+    "source-asc": (attrgetter("source"), False),
+    "source-desc": (attrgetter("source"), True),
+}
+
+
+def apply_sort(results: list[BookResult], sort_by: str) -> list[BookResult]:
+    """Sort search results in-place; unknown keys fall back to price-asc."""
+    key, reverse = _SORT_KEYS.get(sort_by, _SORT_KEYS["price-asc"])
+    results.sort(key=key, reverse=reverse)
+    return results
+
+
+def filter_and_sort(
+    report: SearchReport,
+    filter_text: str,
+    min_price: Optional[float],
+    max_price: Optional[float],
+    condition_filter: str,
+    selected_sources: list[str],
+    isbn_only: bool,
+    isbn_query: str,
+    sort_by: str,
+    currency: str = "",
+    convert: Optional[Callable[[float, str, str], float]] = None,
+) -> list[BookResult]:
+    """Filter and sort a report's results, reusing the list from an identical earlier call.
 
-    if filter_text:
-        needle = filter_text.lower()
-        filtered = [
-            r for r in filtered if needle in f"{r.title} {r.author} {r.source}".lower()
-        ]
+    With ``currency`` and ``convert`` given, results are converted (as copies;
+    the cached report is left untouched) before price filters and sorting.
+    """
+    key = (
+        id(report),
+        currency,
+        filter_text,
+        min_price,
+        max_price,
+        condition_filter,
+        tuple(sorted(selected_sources)),
+        isbn_only,
+        isbn_query,
+        sort_by,
+    )
+    hit = _VIEWS.get(key)
+    if hit is not None and hit[0] is report:
+        _VIEWS.move_to_end(key)
+        return hit[1]
 
-    if min_price is not None:
-        filtered = [r for r in filtered if r.total_price >= min_price]
-    if max_price is not None:
-        filtered = [r for r in filtered if r.total_price <= max_price]
+    results = report.results
+    if currency and convert is not None:
+        results = [_in_currency(r, currency, convert) for r in results]
 
-    if condition_filter:
-        filtered = [r for r in filtered if r.condition.value == condition_filter]
+    filtered = apply_filters(
+        results,
+        filter_text=filter_text,
+        min_price=min_price,
+        max_price=max_price,
+        condition_filter=condition_filter,
+        selected_sources=selected_sources,
+        isbn_only=isbn_only,
+        isbn_query=isbn_query,
+    )
+    view = apply_sort(filtered, sort_by)
 
-    if selected_sources:
-        filtered = [r for r in filtered if r.source in selected_sources]
+    _VIEWS[key] = (report, view)
+    _VIEWS.move_to_end(key)
+    while len(_VIEWS) > _VIEWS_MAX_ITEMS:
+        _VIEWS.popitem(last=False)
+    return view
 
-    if isbn_only and isbn_query:
-        filtered = [r for r in filtered if r.isbn == isbn_query]
 
-    return filtered
+def _in_currency(r: BookResult, currency: str, convert: Callable[[float, str, str], float]) -> BookResult:
+    if r.currency == currency:
+        return r
+    shipping = convert(r.shipping, r.currency, currency) if r.shipping is not None else None
+    return r.model_copy(
+        update={"price": convert(r.price, r.currency, currency), "shipping": shipping, "currency": currency}
+    )
 
 
-def apply_sort(results: list[BookResult], sort_by: str) -> list[BookResult]:
-    """Sort search results in-place."""
-    if sort_by == "price-desc":
-        results.sort(key=lambda r: r.total_price, reverse=True)
-    elif sort_by == "title-asc":
-        results.sort(key=lambda r: r.title)
-    elif sort_by == "title-desc":
-        results.sort(key=lambda r: r.title, reverse=True)
-    elif sort_by == "source-asc":
-        results.sort(key=lambda r: r.source)
-    elif sort_by == "source-desc":
-        results.sort(key=lambda r: r.source, reverse=True)
-    else:
-        # Default: price-asc
-        results.sort(key=lambda r: r.total_price)
-    return results
+def _drop_views(report: SearchReport) -> None:
+    for key in [k for k, (r, _) in _VIEWS.items() if r is report]:
+        del _VIEWS[key]
 
 
 def paginate(results: list[BookResult], page: int, page_size: int) -> tuple[list[BookResult], int, int, int]:
@@ -144,7 +255,8 @@ def compare_lowest_per_source(results: list[BookResult]) -> list[BookResult]:
     for r in results:
         if r.price <= 0:
             continue
-        cur = lowest.get(r.source)
-        if not cur or r.total_price < cur.total_price:
-            lowest[r.source] = r
+        source = r.source
+        cur = lowest.get(source)
+        if cur is None or r.total_price < cur.total_price:
+            lowest[source] = r
     return list(lowest.values())
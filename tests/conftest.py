@@ -0,0 +1,8 @@
+import pytest
+
+from bookfinder.adapters import _cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_response_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(_cache, "CACHE_DIR", tmp_path / "responses")
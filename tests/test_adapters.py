@@ -1,5 +1,11 @@
+import httpx
 import pytest
+from bookfinder.adapters import _browser, registry
 from bookfinder.adapters.abebooks import AbeBooksAdapter
+from bookfinder.adapters.generic import GenericAdapter
+from bookfinder.adapters.hpb import HPBAdapter
+from bookfinder.adapters.pangobooks import PangoBooksAdapter
+from bookfinder.adapters.thriftbooks import ThriftBooksAdapter
 from bookfinder.models import BookQuery, Condition
 
 @pytest.mark.asyncio
@@ -35,3 +41,227 @@ async def test_abebooks_search_mock(httpx_mock):
     
     assert len(results) == 1
     assert results[0].price == 5.0
+
+def test_generic_structured_data_parser():
+    adapter = GenericAdapter("Example", "https://example.com", "https://example.com/s?q={query}")
+    html = """
+    <html><head>
+    <script type="application/ld+json">
+    {"@type": "Book", "name": "Dune", "author": {"name": "Frank Herbert"},
+     "offers": {"price": "7.50", "priceCurrency": "USD", "itemCondition": "UsedCondition"}}
+    </script>
+    <script type='application/ld+json'>not json</script>
+    </head></html>
+    """
+    results = adapter._parse_structured_data(html, httpx.URL("https://example.com/s?q=dune"))
+    assert len(results) == 1
+    assert results[0].title == "Dune"
+    assert results[0].author == "Frank Herbert"
+    assert results[0].price == 7.5
+    assert results[0].condition == Condition.USED
+    assert results[0].url == "https://example.com/s?q=dune"
+
+def test_thriftbooks_parser():
+    adapter = ThriftBooksAdapter()
+    html = """
+    <div class="AllEditionsItem-tile Tile">
+        <div class="AllEditionsItem-tileTitle">Dune</div>
+        <div class="SearchResultListItem-subheading">By Frank Herbert</div>
+        <div class="SearchResultTileItem-rowWrapper">Paperback $7.59 Condition: Very Good</div>
+        <a href="/w/dune_frank-herbert/123/?resultid=abc#edition=1">Dune</a>
+    </div>
+    <div class="AllEditionsItem-tile">
+        <div class="AllEditionsItem-tileTitle">Dune</div>
+        <div class="SearchResultTileItem-rowWrapper">DVD $4.99</div>
+    </div>
+    """
+    results = adapter._parse(html)
+    assert len(results) == 1
+    assert results[0].title == "Dune"
+    assert results[0].author == "Frank Herbert"
+    assert results[0].price == 7.59
+    assert results[0].condition == Condition.USED
+    assert results[0].url == "https://www.thriftbooks.com/w/dune_frank-herbert/123/"
+
+@pytest.mark.asyncio
+async def test_abebooks_search_uses_response_cache(httpx_mock):
+    httpx_mock.add_response(text='<li data-test-id="listing-item"><div data-test-id="item-price">US$ 5.00</div><a data-test-id="listing-title" href="/link">Title</a></li>')
+
+    adapter = AbeBooksAdapter()
+    query = BookQuery(query="Dune")
+    first = await adapter.search(query)
+    second = await adapter.search(query)
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert [r.price for r in second] == [r.price for r in first]
+
+@pytest.mark.asyncio
+async def test_abebooks_does_not_cache_pages_without_results(httpx_mock):
+    httpx_mock.add_response(text="<html><body>Please verify you are human</body></html>")
+    httpx_mock.add_response(text='<li data-test-id="listing-item"><div data-test-id="item-price">US$ 5.00</div><a data-test-id="listing-title" href="/link">Title</a></li>')
+
+    adapter = AbeBooksAdapter()
+    query = BookQuery(query="Dune")
+    assert await adapter.search(query) == []
+    results = await adapter.search(query)
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert [r.price for r in results] == [5.0]
+
+def test_hpb_parser_skips_nested_card_matches():
+    adapter = HPBAdapter()
+    html = """
+    <div class="product-item" data-product-id="1">
+        <div class="product-title">Dune</div>
+        <div class="product-author">Frank Herbert</div>
+        <span class="price">$5.99</span>
+        <a href="/products/dune-123">Dune</a>
+    </div>
+    """
+    results = adapter._parse(html)
+    assert len(results) == 1
+    assert results[0].title == "Dune"
+    assert results[0].author == "Frank Herbert"
+    assert results[0].price == 5.99
+    assert results[0].url == "https://www.hpb.com/products/dune-123"
+
+def test_hpb_parser_prefers_product_item_over_nested_product_card():
+    adapter = HPBAdapter()
+    html = """
+    <div class="product-item">
+        <div class="product-card">
+            <div class="product-title">Dune</div>
+            <span class="price">$5.99</span>
+            <a href="/products/dune-123">Dune</a>
+        </div>
+    </div>
+    """
+    assert [r.title for r in adapter._parse(html)] == ["Dune"]
+
+def test_hpb_parser_keeps_cards_inside_broadly_matching_wrapper():
+    adapter = HPBAdapter()
+    html = """
+    <div class="product-grid"><ul class="grid-items">
+        <li class="product-item"><div class="product-title">Dune</div><span class="price">$5.99</span></li>
+        <li class="product-item"><div class="product-title">Emma</div><span class="price">$4.50</span></li>
+    </ul></div>
+    """
+    assert [r.title for r in adapter._parse(html)] == ["Dune", "Emma"]
+
+def test_pangobooks_parser_keeps_cards_inside_listing_grid():
+    adapter = PangoBooksAdapter()
+    cards = "".join(
+        f'<div data-testid="book-card-{i}"><a href="/books/{i}"><h3>{t}</h3></a>'
+        f'<span class="price">${i + 3}.00</span></div>'
+        for i, t in enumerate(["Dune", "Emma", "Ulysses"])
+    )
+    html = f'<div class="listing-cards-grid">{cards}</div>'
+    results = adapter._parse(html)
+    assert [r.title for r in results] == ["Dune", "Emma", "Ulysses"]
+    assert results[2].url == "https://pangobooks.com/books/2"
+
+@pytest.mark.asyncio
+async def test_pangobooks_caches_only_renders_with_results(monkeypatch):
+    pages = [
+        "<html><body>Are you human?</body></html>",
+        '<a href="/books/dune-1"><h3>Dune</h3><span class="price">$6.00</span></a>',
+        "<html><body>should come from cache</body></html>",
+    ]
+    renders = []
+
+    async def fake_render(url, wait_selector=None, timeout=20000):
+        renders.append(url)
+        return pages[len(renders) - 1]
+
+    monkeypatch.setattr(_browser, "is_available", lambda: True)
+    monkeypatch.setattr(_browser, "fetch_rendered_html", fake_render)
+    adapter = PangoBooksAdapter()
+    query = BookQuery(query="Dune")
+
+    assert await adapter.search(query) == []
+    first = await adapter.search(query)
+    second = await adapter.search(query)
+
+    assert len(renders) == 2
+    assert [r.price for r in first] == [r.price for r in second] == [6.0]
+
+def test_register_generic_refreshes_adapter_list(monkeypatch):
+    monkeypatch.setattr(registry, "_custom_adapters", [])
+    registry.get_all_adapters.cache_clear()
+    try:
+        before = registry.get_all_adapters()
+        assert registry.get_all_adapters() is before
+
+        registry.register_generic("Example", "https://example.com", "https://example.com/s?q={query}")
+        after = registry.get_all_adapters()
+        assert len(after) == len(before) + 1
+        assert after[-1].name == "Example"
+    finally:
+        registry.get_all_adapters.cache_clear()
+
+@pytest.mark.asyncio
+async def test_hpb_search_uses_suggest_api(httpx_mock):
+    httpx_mock.add_response(json={
+        "resources": {"results": {"products": [
+            {"title": "Dune", "vendor": "Frank Herbert", "price": "6.99", "url": "/products/dune-1?_pos=1"},
+            {"title": "Dune Messiah", "price": "0"},
+        ]}}
+    })
+
+    adapter = HPBAdapter()
+    results = await adapter.search(BookQuery(query="Dune"))
+
+    assert len(results) == 1
+    assert results[0].title == "Dune"
+    assert results[0].author == "Frank Herbert"
+    assert results[0].price == 6.99
+    assert results[0].url == "https://www.hpb.com/products/dune-1"
+    assert "suggest.json" in str(httpx_mock.get_requests()[0].url)
+
+class _FakeBrowser:
+    def __init__(self, connected=True):
+        self.connected = connected
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        return object()
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.chromium = self
+        self.launched = []
+
+    async def start(self):
+        return self
+
+    async def launch(self, headless=True):
+        self.launched.append(_FakeBrowser())
+        return self.launched[-1]
+
+    async def stop(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_browser_context_relaunches_after_disconnect(monkeypatch):
+    pw = _FakePlaywright()
+    dead = _FakeBrowser(connected=False)
+    monkeypatch.setattr(_browser, "async_playwright", lambda: pw, raising=False)
+    monkeypatch.setattr(_browser, "_pw", pw)
+    monkeypatch.setattr(_browser, "_browser_obj", dead)
+    monkeypatch.setattr(_browser, "_context", object())
+    monkeypatch.setattr(_browser, "_lock", None)
+
+    context = await _browser.get_context()
+
+    assert dead.closed
+    assert pw.launched and _browser._browser_obj is pw.launched[0]
+    assert _browser._context is context
+    await _browser.shutdown()
@@ -0,0 +1,21 @@
+from click.testing import CliRunner
+
+from bookfinder import cli
+from bookfinder.db.database import PriceDatabase
+from bookfinder.models import BookResult, Condition, SearchReport
+
+
+def test_piped_search_writes_clean_tsv_and_sends_notes_to_stderr(tmp_path, monkeypatch):
+    async def fake_search(query, adapters=None, health_logger=None):
+        return SearchReport(results=[
+            BookResult(title="Dune\tTab", author="Frank\nHerbert", price=5.0,
+                       condition=Condition.USED, source="Fake", url="https://example.com"),
+        ])
+
+    monkeypatch.setattr(cli, "search_all_with_report", fake_search)
+    monkeypatch.setattr(cli, "PriceDatabase", lambda: PriceDatabase(tmp_path / "prices.db"))
+    result = CliRunner().invoke(cli.main, ["search", "Dune", "--sources", "Nowhere", "--no-save"])
+
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == ["Fake\tDune Tab\tFrank Herbert\t$5.00\tused\thttps://example.com"]
+    assert "Unknown sources: nowhere" in result.stderr
@@ -0,0 +1,26 @@
+from bookfinder.config import load_config
+
+
+def test_load_config_is_cached_per_path(tmp_path):
+    path = tmp_path / "config.toml"
+    path.write_text('max_results = 3\n[[sites]]\nname = "X"\nbase_url = "https://x"\nsearch_url_template = "https://x/{query}"\n')
+    load_config.cache_clear()
+
+    cfg = load_config(path)
+    assert cfg.max_results == 3
+    assert cfg.custom_sites[0].name == "X"
+
+    path.write_text("max_results = 7\n")
+    assert load_config(path) is cfg
+
+    load_config.cache_clear()
+    assert load_config(path).max_results == 7
+
+
+def test_load_config_reads_timeout(tmp_path):
+    path = tmp_path / "config.toml"
+    path.write_text("timeout = 4.5\n")
+    load_config.cache_clear()
+
+    assert load_config(path).timeout == 4.5
+    assert load_config(tmp_path / "missing.toml").timeout == 10.0
@@ -1,4 +1,5 @@
 import pytest
+from bookfinder.db import database
 from bookfinder.db.database import PriceDatabase
 from bookfinder.models import BookResult, Condition
 
@@ -56,3 +57,92 @@ def test_wishlist_operations(temp_db):
 
     temp_db.remove_from_wishlist(wishlist_id)
     assert len(temp_db.get_wishlist()) == 0
+
+def test_db_uses_wal_and_applies_schema_once(tmp_path):
+    db_path = tmp_path / "wal.db"
+    with PriceDatabase(db_path) as db:
+        mode = db._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+    assert db_path.resolve() in database._SCHEMA_APPLIED
+
+    # A second connection to the same file still sees the tables
+    with PriceDatabase(db_path) as db:
+        assert db.get_wishlist() == []
+
+def test_get_average_price_includes_shipping(temp_db):
+    results = [
+        BookResult(title="Dune", author="Frank Herbert", price=p, shipping=s, currency="USD",
+                   condition=Condition.USED, source="TestStore", url="http://example.com/dune",
+                   isbn="1234567890")
+        for p, s in [(10.0, 2.0), (4.0, None), (0.0, None)]
+    ]
+    temp_db.save_results(results)
+    assert temp_db.get_average_price(isbn="1234567890") == 8.0
+
+def test_check_wishlist_deals_matches_isbn_or_title(temp_db):
+    temp_db.add_to_wishlist("Dune", "Frank Herbert", "", 15.0)
+    temp_db.add_to_wishlist("Something Else", "", "999", 5.0)
+    temp_db.add_to_wishlist("Untracked Price", "", "", None)
+
+    def result(title, price, isbn=""):
+        return BookResult(title=title, author="", price=price, currency="USD",
+                          condition=Condition.USED, source="TestStore", url="", isbn=isbn)
+
+    results = [result("DUNE (Paperback)", 12.0), result("Dune", 20.0), result("Other", 4.0, "999"),
+               result("Dune", 0.0)]
+    deals = temp_db.check_wishlist_deals(results)
+    assert [(e.title, r.title) for e, r in deals] == [
+        ("Dune", "DUNE (Paperback)"),
+        ("Something Else", "Other"),
+    ]
+
+def test_iter_price_history_yields_row_dicts(temp_db):
+    temp_db.save_results([
+        BookResult(title="Dune", author="Frank Herbert", price=10.0, currency="USD",
+                   condition=Condition.USED, source="TestStore", url="http://example.com/dune",
+                   isbn="1234567890")
+    ])
+    rows = list(temp_db.iter_price_history(title="Dune"))
+    assert len(rows) == 1
+    assert rows[0]["title"] == "Dune"
+    assert rows[0]["condition"] == "used"
+
+def test_save_results_skips_same_day_duplicates(temp_db):
+    def result(price, url="http://example.com/dune"):
+        return BookResult(title="Dune", author="Frank Herbert", price=price, currency="USD",
+                          condition=Condition.USED, source="TestStore", url=url, isbn="1234567890")
+
+    assert temp_db.save_results([result(10.0), result(10.0, "http://example.com/dune-2")]) == 2
+    assert temp_db.save_results([result(10.0), result(9.0)]) == 1
+    assert len(temp_db.get_price_history(isbn="1234567890")) == 3
+
+def test_dedupe_index_migration_drops_existing_duplicates(tmp_path):
+    db_path = tmp_path / "old.db"
+    with PriceDatabase(db_path) as db:
+        db._conn.execute("DROP INDEX idx_price_dedupe")
+        for _ in range(3):
+            db._conn.execute(
+                "INSERT INTO price_history (isbn, title, price, source, url) VALUES ('1', 'Dune', 5.0, 'X', 'u')"
+            )
+        db._conn.commit()
+
+    database._SCHEMA_APPLIED.discard(db_path.resolve())
+    with PriceDatabase(db_path) as db:
+        assert len(db.get_price_history(isbn="1")) == 1
+
+def test_db_reapplies_schema_when_file_is_replaced(tmp_path):
+    db_path = tmp_path / "replaced.db"
+    with PriceDatabase(db_path):
+        pass
+    for path in tmp_path.glob("replaced.db*"):
+        path.unlink()
+
+    with PriceDatabase(db_path) as db:
+        assert db.get_wishlist() == []
+
+def test_transaction_rolls_back_on_error(temp_db):
+    with pytest.raises(RuntimeError), temp_db._transaction():
+        temp_db._conn.execute("INSERT INTO wishlist (title) VALUES ('Dune')")
+        raise RuntimeError("boom")
+    assert temp_db.get_wishlist() == []
+    assert not temp_db._conn.in_transaction
@@ -47,3 +47,46 @@ def test_book_query_validation():
     
     q2 = BookQuery(query="Dune", max_results=10)
     assert q2.max_results == 10
+
+def test_book_result_currency_defaults_to_usd():
+    res = BookResult(
+        title="Dune",
+        author="Frank Herbert",
+        price=10.0,
+        condition=Condition.USED,
+        source="Test",
+        url="http://example.com"
+    )
+    assert res.currency == "USD"
+
+def test_book_result_total_price_tracks_assignment():
+    res = BookResult(
+        title="Dune",
+        author="Frank Herbert",
+        price=10.0,
+        currency="USD",
+        condition=Condition.USED,
+        source="Test",
+        url="http://example.com",
+    )
+    assert res.total_price == 10.0
+    res.shipping = 3.0
+    assert res.total_price == 13.0
+    res.price = 5.0
+    assert res.total_price == 8.0
+    assert "total_price" not in res.model_dump()
+    assert res.model_copy(update={"shipping": 1.0}).total_price == 6.0
+
+def test_book_result_search_text_is_cached_and_refreshed():
+    res = BookResult(
+        title="Dune",
+        author="Frank Herbert",
+        price=10.0,
+        condition=Condition.USED,
+        source="Test",
+        url="http://example.com",
+    )
+    assert res.search_text == "dune frank herbert test"
+    assert "search_text" not in res.model_dump()
+    res.title = "Dune Messiah"
+    assert res.search_text == "dune messiah frank herbert test"
@@ -1,10 +1,13 @@
-from bookfinder.utils.parsing import parse_price, parse_condition, parse_shipping
+from bs4 import BeautifulSoup
+from bookfinder.utils.parsing import clean_text, parse_price, parse_condition, parse_shipping
 from bookfinder.models import Condition
 
 def test_parse_price():
     assert parse_price("$12.99") == 12.99
     assert parse_price("£10,000.50") == 10000.50
     assert parse_price("Free") == 0.0
+    assert parse_price("US$ 7.50 + shipping") == 7.50
+    assert parse_price("12.99.5") == 12.99
     assert parse_price("") == 0.0
 
 def test_parse_condition():
@@ -18,3 +21,7 @@ def test_parse_shipping():
     assert parse_shipping("FREE shipping") == 0.0
     assert parse_shipping("US$ 5.00 shipping") == 5.00
     assert parse_shipping("Calculated at checkout") is None
+
+def test_clean_text():
+    el = BeautifulSoup("<h3>  Dune:\n  <i>Messiah</i> </h3>", "lxml").h3
+    assert clean_text(el) == "Dune: Messiah"
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from bookfinder.adapters.base import BaseAdapter
+from bookfinder.models import BookQuery, BookResult, Condition
+from bookfinder.search import search_all, search_all_with_report
+
+
+class FakeAdapter(BaseAdapter):
+    def __init__(self, name, prices=(), delay=0.0, error=None):
+        self._name = name
+        self._prices = prices
+        self._delay = delay
+        self._error = error
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def base_url(self):
+        return "https://example.com"
+
+    async def search(self, query):
+        await asyncio.sleep(self._delay)
+        if self._error:
+            raise self._error
+        return [
+            BookResult(
+                title=query.query,
+                author="Someone",
+                price=p,
+                currency="USD",
+                condition=Condition.USED,
+                source=self._name,
+                url="https://example.com",
+            )
+            for p in self._prices
+        ]
+
+
+@pytest.mark.asyncio
+async def test_search_all_merges_and_skips_failures():
+    adapters = [
+        FakeAdapter("A", prices=(9.0, 0.0)),
+        FakeAdapter("B", prices=(4.0,)),
+        FakeAdapter("Broken", error=RuntimeError("boom")),
+        FakeAdapter("Slow", prices=(1.0,), delay=5.0),
+    ]
+    results = await search_all(BookQuery(query="Dune"), adapters=adapters, timeout=0.2)
+
+    assert [(r.source, r.price) for r in results] == [("B", 4.0), ("A", 9.0), ("A", 0.0)]
+
+
+@pytest.mark.asyncio
+async def test_search_all_with_report_collects_batches_as_they_finish():
+    adapters = [
+        FakeAdapter("Slow", prices=(3.0,), delay=0.1),
+        FakeAdapter("Fast", prices=(5.0, 2.0)),
+    ]
+    report = await search_all_with_report(BookQuery(query="Dune"), adapters=adapters)
+
+    assert [(r.source, r.price) for r in report.results] == [("Fast", 2.0), ("Slow", 3.0), ("Fast", 5.0)]
+    assert report.source_counts == {"Slow": 1, "Fast": 2}
+    assert report.errors == {}
+
+
+@pytest.mark.asyncio
+async def test_search_all_with_report_times_out_slow_adapter():
+    adapters = [FakeAdapter("A", prices=(4.0,)), FakeAdapter("Slow", prices=(1.0,), delay=5.0)]
+    report = await search_all_with_report(BookQuery(query="Dune"), adapters=adapters, timeout=0.1)
+
+    assert [r.source for r in report.results] == ["A"]
+    assert report.errors == {"Slow": "timed out after 0.1s"}
+
+
+@pytest.mark.asyncio
+async def test_search_all_with_report_honours_adapter_min_timeout():
+    browser = FakeAdapter("Browser", prices=(2.0,), delay=0.2)
+    browser.min_timeout = 1.0
+    report = await search_all_with_report(BookQuery(query="Dune"), adapters=[browser], timeout=0.05)
+
+    assert [r.source for r in report.results] == ["Browser"]
+    assert report.errors == {}
+
+
+@pytest.mark.asyncio
+async def test_search_all_timeout_excludes_time_queued_for_a_slot():
+    adapters = [FakeAdapter(f"S{i}", prices=(float(i),), delay=0.15) for i in range(10)]
+    results = await search_all(BookQuery(query="Dune"), adapters=adapters, timeout=0.2)
+
+    assert len(results) == 10
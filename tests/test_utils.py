@@ -1,4 +1,38 @@
-from bookfinder.web.utils import looks_like_isbn, bool_value
+import asyncio
+from collections import OrderedDict
+
+import pytest
+
+from bookfinder.models import BookResult, Condition, SearchReport
+from bookfinder.web import utils
+from bookfinder.web.utils import (
+    apply_filters,
+    apply_sort,
+    bool_value,
+    compare_lowest_per_source,
+    filter_and_sort,
+    looks_like_isbn,
+)
+
+
+def make_result(title="Dune", price=5.0, source="A", condition=Condition.USED, **kwargs):
+    return BookResult(title=title, author=kwargs.pop("author", ""), price=price,
+                      condition=condition, source=source, url="", **kwargs)
+
+
+@pytest.fixture
+def search_calls(monkeypatch):
+    """Replace the adapter fan-out with a short fake; returns the queries it saw."""
+    calls = []
+
+    async def fake_search(query, health_logger=None):
+        calls.append(query.query)
+        await asyncio.sleep(0.01)
+        return SearchReport()
+
+    monkeypatch.setattr(utils, "search_all_with_report", fake_search)
+    monkeypatch.setattr(utils, "_CACHE", OrderedDict())
+    return calls
 
 def test_looks_like_isbn():
     assert looks_like_isbn("1234567890") is True
@@ -15,3 +49,103 @@ def test_bool_value():
     assert bool_value("0") is False
     assert bool_value(None) is False
     assert bool_value("off") is False
+
+@pytest.mark.asyncio
+async def test_cached_search_evicts_least_recently_used(search_calls, monkeypatch):
+    monkeypatch.setattr(utils, "_CACHE_MAX_ITEMS", 2)
+    for q in ["a", "b", "a", "c", "a", "b"]:
+        await utils.cached_search(q, 5, False)
+    # "a" stays hot, so "b" is the one evicted when "c" arrives
+    assert search_calls == ["a", "b", "c", "b"]
+
+@pytest.mark.asyncio
+async def test_cached_search_normalizes_key_and_skips_blank(search_calls):
+    for q in ["Dune", "  dune ", "DUNE", "   "]:
+        await utils.cached_search(q, 5, False)
+    assert search_calls == ["Dune"]
+
+def test_apply_filters_combines_all_conditions():
+    results = [
+        make_result("Dune", 5.0, isbn="1"),
+        make_result("Dune Messiah", 12.0, isbn="1"),
+        make_result("Dune", 6.0, source="B", isbn="1"),
+        make_result("Dune", 7.0, condition=Condition.NEW, isbn="1"),
+        make_result("Dune", 8.0, isbn="2"),
+        make_result("Emma", 4.0, isbn="1"),
+    ]
+    filtered = apply_filters(results, filter_text="DUNE", min_price=5.0, max_price=10.0,
+                             condition_filter="used", selected_sources=["A"],
+                             isbn_only=True, isbn_query="1")
+    assert filtered == [results[0]]
+
+    unfiltered = apply_filters(results, "", None, None, "", [], False, "")
+    assert unfiltered == results
+    assert unfiltered is not results
+
+def test_apply_sort_orders_and_defaults_to_price():
+    results = [make_result(t, p, s) for t, p, s in [("B", 3.0, "Y"), ("A", 9.0, "Z"), ("C", 1.0, "X")]]
+    assert [r.title for r in apply_sort(results, "title-desc")] == ["C", "B", "A"]
+    assert [r.source for r in apply_sort(results, "source-asc")] == ["X", "Y", "Z"]
+    assert [r.price for r in apply_sort(results, "bogus")] == [1.0, 3.0, 9.0]
+
+@pytest.mark.asyncio
+async def test_cached_search_coalesces_concurrent_requests(search_calls):
+    reports = await asyncio.gather(*(utils.cached_search("Dune", 5, False) for _ in range(3)))
+    assert search_calls == ["Dune"]
+    assert reports[0] is reports[1] is reports[2]
+    assert utils._INFLIGHT == {}
+
+@pytest.mark.asyncio
+async def test_cached_search_survives_first_caller_cancelling(search_calls):
+    first = asyncio.ensure_future(utils.cached_search("Dune", 5, False))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(utils.cached_search("Dune", 5, False))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    report = await waiter
+    assert first.cancelled()
+    assert not waiter.cancelled()
+    assert isinstance(report, SearchReport)
+    assert search_calls == ["Dune"]
+    assert utils._INFLIGHT == {}
+
+def test_compare_lowest_per_source_skips_free_results():
+    results = [
+        make_result(price=p, shipping=s, source=src)
+        for src, p, s in [("A", 5.0, 3.0), ("B", 0.0, None), ("A", 6.0, None), ("B", 4.0, None)]
+    ]
+    assert [(r.source, r.total_price) for r in compare_lowest_per_source(results)] == [("A", 6.0), ("B", 4.0)]
+
+def test_filter_and_sort_reuses_view_for_same_report_and_filters():
+    report = SearchReport(results=[make_result(price=p) for p in (9.0, 3.0)])
+    args = ("", None, None, "", [], False, "Dune")
+    first = filter_and_sort(report, *args, sort_by="price-asc")
+    assert [r.price for r in first] == [3.0, 9.0]
+    assert filter_and_sort(report, *args, sort_by="price-asc") is first
+    assert filter_and_sort(report, *args, sort_by="price-desc") is not first
+    assert filter_and_sort(SearchReport(results=report.results), *args, sort_by="price-asc") is not first
+
+def test_filter_and_sort_converts_copies_per_display_currency():
+    report = SearchReport(results=[make_result(price=10.0), make_result(price=8.0, currency="GBP")])
+    args = ("", None, 11.0, "", [], False, "Dune")
+
+    def to_usd(price, from_curr, to_curr):
+        return price * 2 if from_curr == "GBP" else price
+
+    usd = filter_and_sort(report, *args, sort_by="price-asc", currency="USD", convert=to_usd)
+    assert [(r.price, r.currency) for r in usd] == [(10.0, "USD")]
+    native = filter_and_sort(report, *args, sort_by="price-asc")
+    assert [(r.price, r.currency) for r in native] == [(8.0, "GBP"), (10.0, "USD")]
+    assert report.results[1].price == 8.0
+
+@pytest.mark.asyncio
+async def test_evicted_reports_drop_their_views(search_calls, monkeypatch):
+    monkeypatch.setattr(utils, "_CACHE_MAX_ITEMS", 1)
+    monkeypatch.setattr(utils, "_VIEWS", OrderedDict())
+    first = await utils.cached_search("a", 5, False)
+    filter_and_sort(first, "", None, None, "", [], False, "a", sort_by="price-asc")
+    assert len(utils._VIEWS) == 1
+
+    await utils.cached_search("b", 5, False)
+    assert utils._VIEWS == {}